@@ -3,6 +3,7 @@ Browser Manager Module - Handles browser initialization and management for TikTo
 """
 
 import asyncio
+from contextlib import asynccontextmanager
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 import logging
 
@@ -12,11 +13,162 @@ logging.basicConfig(
 )
 logger = logging.getLogger('browser_manager')
 
+# Counts the elements matching a selector, or with a pattern, the distinct first capture groups
+# (or whole matches) of the pattern against their href attributes
+_COUNT_MATCHES_JS = """([selector, pattern]) => {
+    const elements = document.querySelectorAll(selector);
+    if (!pattern) {
+        return elements.length;
+    }
+    const hrefPattern = new RegExp(pattern);
+    const keys = new Set();
+    for (const element of elements) {
+        const match = hrefPattern.exec(element.getAttribute('href') || '');
+        if (match) {
+            keys.add(match[1] ?? match[0]);
+        }
+    }
+    return keys.size;
+}"""
+
+class BrowserPool:
+    """
+    Owns a single Playwright instance and Chromium browser shared by all BrowserManager
+    instances in the process, so the browser is launched once instead of once per manager.
+    Users are counted with acquire/release and the browser is shut down when the last one
+    releases it. Playwright objects belong to the event loop they were created in, so the
+    pool starts over when used from a new loop (e.g. a second asyncio.run).
+    """
+    
+    _playwright = None
+    _browser = None
+    _lock = None
+    _loop = None
+    _users = 0
+    
+    @classmethod
+    def _bind_to_running_loop(cls):
+        """
+        Reset the pool if it was created in a different (finished) event loop
+        """
+        loop = asyncio.get_running_loop()
+        if cls._loop is not loop:
+            if cls._browser is not None:
+                logger.warning("Discarding shared browser left over from a previous event loop")
+            cls._playwright = None
+            cls._browser = None
+            cls._users = 0
+            cls._lock = asyncio.Lock()
+            cls._loop = loop
+    
+    @classmethod
+    async def get_browser(cls, headless=False, args=None):
+        """
+        Get the shared browser, launching it on first use
+        
+        Args:
+            headless (bool): Whether to launch the browser in headless mode
+            args (list, optional): Extra Chromium command-line arguments
+            
+        Returns:
+            Browser: Playwright browser object
+        """
+        cls._bind_to_running_loop()
+        
+        async with cls._lock:
+            if cls._browser is None or not cls._browser.is_connected():
+                logger.info("Launching shared browser")
+                if cls._playwright is None:
+                    cls._playwright = await async_playwright().start()
+                cls._browser = await cls._playwright.chromium.launch(
+                    headless=headless,
+                    args=args or []
+                )
+        
+        return cls._browser
+    
+    @classmethod
+    async def acquire(cls, headless=False, args=None):
+        """
+        Register a user of the shared browser and get the browser; pair with release()
+        
+        Args:
+            headless (bool): Whether to launch the browser in headless mode
+            args (list, optional): Extra Chromium command-line arguments
+            
+        Returns:
+            Browser: Playwright browser object
+        """
+        cls._bind_to_running_loop()
+        cls._users += 1
+        try:
+            return await cls.get_browser(headless, args)
+        except BaseException:
+            await cls.release()
+            raise
+    
+    @classmethod
+    async def release(cls):
+        """
+        Unregister a user of the shared browser, shutting it down if it was the last one
+        """
+        cls._bind_to_running_loop()
+        if cls._users == 0:
+            return
+        
+        cls._users -= 1
+        if cls._users == 0:
+            await cls.shutdown()
+    
+    @classmethod
+    @asynccontextmanager
+    async def context(cls, headless=False, args=None, **context_options):
+        """
+        Open a fresh, isolated browser context on the shared browser and yield a page in it.
+        The context is closed on exit; the browser stays alive while it has other users.
+        
+        Args:
+            headless (bool): Whether to launch the browser in headless mode (first use only)
+            args (list, optional): Extra Chromium command-line arguments (first use only)
+            **context_options: Options passed to Browser.new_context
+            
+        Yields:
+            Page: Playwright page object
+        """
+        browser = await cls.acquire(headless, args)
+        try:
+            context = await browser.new_context(**context_options)
+            try:
+                yield await context.new_page()
+            finally:
+                await context.close()
+        finally:
+            await cls.release()
+    
+    @classmethod
+    async def shutdown(cls):
+        """
+        Close the shared browser and stop Playwright, whether or not it still has users
+        """
+        logger.info("Shutting down shared browser")
+        cls._users = 0
+        
+        if cls._browser:
+            await cls._browser.close()
+            cls._browser = None
+        
+        if cls._playwright:
+            await cls._playwright.stop()
+            cls._playwright = None
+
 class BrowserManager:
     """
     Manages browser initialization, navigation, and interaction for TikTok scraping
     """
     
+    # Pooled contexts are closed and replaced after this many pages to bound memory growth
+    MAX_USES_PER_CONTEXT = 50
+    
     def __init__(self, config=None):
         """
         Initialize the browser manager with configuration
@@ -28,7 +180,6 @@ class BrowserManager:
         self.browser = None
         self.context = None
         self.page = None
-        self.playwright = None
         
         # Default configuration
         self.headless = self.config.get('headless', False)
@@ -36,6 +187,33 @@ class BrowserManager:
         self.viewport = self.config.get('viewport', {'width': 1280, 'height': 800})
         self.timeout = self.config.get('page_load_timeout', 30000)
         self.request_delay = self.config.get('request_delay', 2)
+        self.content_selector = self.config.get('content_selector', '[data-e2e="user-post-item"], [data-e2e="user-avatar"]')
+        self.content_timeout = self.config.get('content_timeout', 5000)
+        self.browser_args = self.config.get('browser_args', [
+            '--disable-dev-shm-usage',
+            '--disable-gpu',
+            '--disable-blink-features=AutomationControlled'
+        ])
+        # Subresources that are never read by the scraper and are aborted to save bandwidth
+        self.blocked_resource_types = set(self.config.get('blocked_resource_types', ['image', 'media', 'font']))
+        
+        # Rate limiting state shared by all navigations (lock is created lazily inside the running loop)
+        self._rate_lock = None
+        self._next_request_time = 0.0
+        
+        # Whether this manager holds a reference on the shared browser (released by close)
+        self._holds_browser = False
+        
+        # Pool of reusable browser contexts for acquire_page (queue is created lazily inside the running loop)
+        self.pool_size = self.config.get('pool_size', 4)
+        self._context_pool = None
+        self._context_uses = {}
+        
+        # Session state (cookies, local storage) captured after the login popup is first dismissed;
+        # contexts created afterwards start from it so the popup does not come back
+        self.storage_state = None
+        # Contexts where the popup was dismissed or that were created from storage_state
+        self._popup_free_contexts = set()
     
     async def initialize(self):
         """
@@ -45,18 +223,12 @@ class BrowserManager:
             Page: Playwright page object
         """
         logger.info("Initializing browser")
-        self.playwright = await async_playwright().start()
         
-        # Launch browser
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless
-        )
+        # Reuse the process-wide browser instead of launching one per manager
+        self.browser = await self._get_browser()
         
         # Create a new browser context
-        self.context = await self.browser.new_context(
-            user_agent=self.user_agent,
-            viewport=self.viewport
-        )
+        self.context = await self._new_context()
         
         # Create a new page
         self.page = await self.context.new_page()
@@ -67,71 +239,289 @@ class BrowserManager:
         logger.info("Browser initialized successfully")
         return self.page
     
-    async def navigate(self, url):
+    async def _get_browser(self):
+        """
+        Get the shared browser, registering this manager as one of its users on first call
+        
+        Returns:
+            Browser: Playwright browser object
+        """
+        if not self._holds_browser:
+            self._holds_browser = True
+            try:
+                return await BrowserPool.acquire(self.headless, self.browser_args)
+            except BaseException:
+                self._holds_browser = False
+                raise
+        
+        return await BrowserPool.get_browser(self.headless, self.browser_args)
+    
+    async def _new_context(self):
+        """
+        Create a browser context on the shared browser with this manager's settings
+        
+        Returns:
+            BrowserContext: Playwright browser context
+        """
+        browser = await self._get_browser()
+        context = await browser.new_context(
+            user_agent=self.user_agent,
+            viewport=self.viewport,
+            bypass_csp=True,
+            storage_state=self.storage_state
+        )
+        if self.storage_state is not None:
+            self._popup_free_contexts.add(context)
+        
+        # Skip loading subresources the scraper doesn't use
+        if self.blocked_resource_types:
+            await context.route('**/*', self._block_resources)
+        
+        return context
+    
+    @asynccontextmanager
+    async def acquire_page(self):
+        """
+        Open a page in a pooled browser context, independent of the manager's main page,
+        so several pages can be scraped concurrently. At most pool_size pages are open at
+        once; the page is closed on exit and its context is returned to the pool, or
+        replaced if it failed or has reached MAX_USES_PER_CONTEXT. If the manager was
+        closed in the meantime, the context is closed instead.
+        
+        Yields:
+            Page: Playwright page object
+        """
+        if self._context_pool is None:
+            # Each slot holds a context, or None until a context is first needed
+            self._context_pool = asyncio.Queue()
+            for _ in range(self.pool_size):
+                self._context_pool.put_nowait(None)
+        
+        # close() drops the pool while pages may still be checked out from it
+        pool = self._context_pool
+        context = await pool.get()
+        if pool is not self._context_pool:
+            # The manager was closed while this caller waited for a slot; wake the next waiter
+            pool.put_nowait(None)
+            raise RuntimeError("BrowserManager was closed while waiting for a page")
+        failed = False
+        try:
+            if context is None:
+                context = await self._new_context()
+                self._context_uses[context] = 0
+            
+            page = await context.new_page()
+            page.set_default_timeout(self.timeout)
+            try:
+                yield page
+            finally:
+                await page.close()
+        except Exception:
+            failed = True
+            raise
+        finally:
+            if context is not None:
+                self._context_uses[context] += 1
+                if (pool is not self._context_pool or failed
+                        or self._context_uses[context] >= self.MAX_USES_PER_CONTEXT):
+                    context = await self._retire_context(context)
+            pool.put_nowait(context)
+    
+    async def _retire_context(self, context):
+        """
+        Close a pooled context so its slot gets a fresh one on next use
+        
+        Args:
+            context (BrowserContext): Context to close
+            
+        Returns:
+            None: Placeholder to put back in the pool
+        """
+        self._context_uses.pop(context, None)
+        self._popup_free_contexts.discard(context)
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled context: {e}")
+        return None
+    
+    async def _block_resources(self, route):
+        """
+        Abort requests for blocked resource types and let everything else through
+        
+        Args:
+            route (Route): Playwright route for the intercepted request
+        """
+        if route.request.resource_type in self.blocked_resource_types:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def navigate(self, url, page=None):
         """
         Navigate to a URL
         
         Args:
             url (str): URL to navigate to
+            page (Page, optional): Page to navigate; defaults to the manager's main page
             
         Returns:
             Page: Playwright page object
         """
-        if not self.page:
-            await self.initialize()
+        if page is None:
+            if not self.page:
+                await self.initialize()
+            page = self.page
+        
+        # Space navigations to avoid rate limiting
+        await self._wait_for_request_slot()
         
         logger.info(f"Navigating to {url}")
-        await self.page.goto(url, wait_until='networkidle', timeout=self.timeout)
+        await page.goto(url, wait_until='domcontentloaded', timeout=self.timeout)
         
-        # Add delay to avoid rate limiting
-        await asyncio.sleep(self.request_delay)
+        # Wait for page content instead of network idle (TikTok keeps connections open)
+        try:
+            await page.wait_for_selector(self.content_selector, timeout=self.content_timeout)
+        except Exception as e:
+            logger.debug(f"Content selector not found on {url}: {e}")
         
-        return self.page
+        return page
+    
+    async def _wait_for_request_slot(self):
+        """
+        Wait until at least request_delay seconds have passed since the previous navigation.
+        The budget is shared, so concurrent navigations are spaced out as well.
+        """
+        if self._rate_lock is None:
+            self._rate_lock = asyncio.Lock()
+        
+        async with self._rate_lock:
+            loop = asyncio.get_running_loop()
+            wait_time = self._next_request_time - loop.time()
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+            self._next_request_time = loop.time() + self.request_delay
+    
+    def login_popup_handled(self, page=None):
+        """
+        Check whether the login popup is already dealt with in a page's browser context, either
+        because it was dismissed there or because the context started from the saved session
+        
+        Args:
+            page (Page, optional): Page to check; defaults to the manager's main page
+            
+        Returns:
+            bool: True if handle_login_popup can be skipped for this page
+        """
+        page = page or self.page
+        return page.context in self._popup_free_contexts
     
-    async def handle_login_popup(self):
+    async def handle_login_popup(self, page=None):
         """
-        Handle TikTok login popup by clicking "Continue as guest"
+        Handle TikTok login popup by clicking "Continue as guest". Once handled, the page's
+        context is marked for login_popup_handled, and the first time the session state is
+        saved for new contexts.
         
+        Args:
+            page (Page, optional): Page showing the popup; defaults to the manager's main page
+            
         Returns:
             bool: True if popup was handled, False otherwise
         """
+        page = page or self.page
         try:
             # Wait for login container to appear
-            await self.page.wait_for_selector('//div[@id="loginContainer"]', timeout=5000)
+            await page.wait_for_selector('//div[@id="loginContainer"]', timeout=5000)
             
             # Click "Continue as guest" button
-            await self.page.click('text="Continue as guest"')
+            await page.click('text="Continue as guest"')
             
             logger.info("Login popup handled successfully")
             await asyncio.sleep(2)
+            
+            self._popup_free_contexts.add(page.context)
+            if self.storage_state is None:
+                self.storage_state = await page.context.storage_state()
             return True
         except Exception as e:
             logger.info(f"No login popup detected or unable to handle: {e}")
             return False
     
-    async def scroll_page(self, scrolls=5, scroll_delay=1):
+    async def scroll_page(self, scrolls=5, scroll_delay=1, page=None):
         """
         Scroll down the page to load more content
         
         Args:
             scrolls (int): Number of times to scroll
             scroll_delay (int): Delay between scrolls in seconds
+            page (Page, optional): Page to scroll; defaults to the manager's main page
             
         Returns:
             Page: Playwright page object
         """
+        page = page or self.page
         logger.info(f"Scrolling page {scrolls} times")
         
         for i in range(scrolls):
             # Scroll down
-            await self.page.evaluate('window.scrollBy(0, window.innerHeight)')
+            await page.evaluate('window.scrollBy(0, window.innerHeight)')
             
             # Wait for content to load
             await asyncio.sleep(scroll_delay)
             
             logger.debug(f"Completed scroll {i+1}/{scrolls}")
         
-        return self.page
+        return page
+    
+    async def scroll_until(self, selector, target=None, max_scrolls=10, stable_rounds=2, scroll_delay=1, page=None,
+                           href_pattern=None):
+        """
+        Scroll down the page until enough elements matching a selector are loaded, the page
+        stops loading new ones, or max_scrolls is reached
+        
+        Args:
+            selector (str): CSS selector for the elements being loaded
+            target (int, optional): Stop once at least this many elements are present
+            max_scrolls (int): Maximum number of times to scroll
+            stable_rounds (int): Stop after this many consecutive scrolls add no elements
+            scroll_delay (int): Delay between scrolls in seconds
+            page (Page, optional): Page to scroll; defaults to the manager's main page
+            href_pattern (str, optional): Regex (valid in JavaScript) that elements' href must
+                match; when given, elements are counted by the distinct values of its first
+                capture group, e.g. unique usernames rather than every link to a profile
+            
+        Returns:
+            Page: Playwright page object
+        """
+        page = page or self.page
+        count = await page.evaluate(_COUNT_MATCHES_JS, [selector, href_pattern])
+        unchanged = 0
+        scrolls = 0
+        
+        while scrolls < max_scrolls:
+            if target is not None and count >= target:
+                break
+            
+            # Scroll down
+            await page.evaluate('window.scrollBy(0, window.innerHeight)')
+            
+            # Wait for content to load
+            await asyncio.sleep(scroll_delay)
+            scrolls += 1
+            
+            new_count = await page.evaluate(_COUNT_MATCHES_JS, [selector, href_pattern])
+            logger.debug(f"Completed scroll {scrolls}/{max_scrolls}: {new_count} elements")
+            
+            if new_count > count:
+                unchanged = 0
+            else:
+                unchanged += 1
+                if unchanged >= stable_rounds:
+                    break
+            count = new_count
+        
+        logger.info(f"Scrolled page {scrolls} times, {count} elements loaded")
+        return page
     
     async def extract_text(self, selector):
         """
@@ -143,35 +533,38 @@ class BrowserManager:
         Returns:
             list: List of extracted text strings
         """
-        elements = await self.page.query_selector_all(selector)
-        texts = []
-        
-        for element in elements:
-            text = await element.inner_text() if element else ""
-            texts.append(text)
-        
-        return texts
+        # Collect all texts in the browser in a single round trip
+        return await self.page.eval_on_selector_all(selector, "els => els.map(e => e.innerText)")
     
     async def close(self):
         """
-        Close the browser and all associated resources
+        Close this manager's page and contexts. The shared browser is shut down once the
+        last manager using it is closed.
         """
-        logger.info("Closing browser")
+        logger.info("Closing browser context")
         
         if self.page:
             await self.page.close()
             self.page = None
         
         if self.context:
+            self._popup_free_contexts.discard(self.context)
             await self.context.close()
             self.context = None
         
-        if self.browser:
-            await self.browser.close()
-            self.browser = None
+        # Close idle pooled contexts; contexts still checked out by acquire_page are closed
+        # when their page is returned
+        if self._context_pool is not None:
+            while not self._context_pool.empty():
+                context = self._context_pool.get_nowait()
+                if context is not None:
+                    await self._retire_context(context)
+            self._context_pool = None
+        
+        self.browser = None
         
-        if self.playwright:
-            await self.playwright.stop()
-            self.playwright = None
+        if self._holds_browser:
+            self._holds_browser = False
+            await BrowserPool.release()
         
-        logger.info("Browser closed successfully")
+        logger.info("Browser context closed successfully")
@@ -4,6 +4,7 @@ Command-line interface for the TikTok Parser
 """
 
 import argparse
+import asyncio
 import logging
 import os
 import sys
@@ -27,7 +28,7 @@ def parse_arguments():
     
     parser.add_argument('topics', nargs='+', help='Topics (hashtags) to search for')
     parser.add_argument('--config', '-c', help='Path to configuration file')
-    parser.add_argument('--output-format', '-f', choices=['csv', 'json'], default='csv',
+    parser.add_argument('--output-format', '-f', choices=['csv', 'json', 'jsonl'], default='csv',
                         help='Output format (default: csv)')
     parser.add_argument('--output-dir', '-o', default='./hybrid_output',
                         help='Directory for output files (default: ./hybrid_output)')
@@ -39,6 +40,8 @@ def parse_arguments():
                         help='Maximum profiles to process per topic (default: 20)')
     parser.add_argument('--results-per-hashtag', '-r', type=int, default=20,
                         help='Number of results to fetch per hashtag (default: 20)')
+    parser.add_argument('--cache-ttl', type=float, default=0, metavar='HOURS',
+                        help='Reuse Apify results cached by earlier runs for this many hours (default: 0, no cache)')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Enable verbose logging')
     
@@ -56,33 +59,25 @@ def main():
         print("Please set the environment variable or provide a config file with the API token.")
         sys.exit(1)
     
-    # Create config file if using command line arguments without a config file
-    if not args.config:
-        import json
-        import tempfile
-        
-        config = {
-            "apify_api_token": api_token,
-            "tiktok_actor_id": "clockworks/tiktok-scraper",
-            "profile_actor_id": "clockworks/tiktok-profile-scraper",
-            "results_per_hashtag": args.results_per_hashtag,
-            "max_profiles_per_topic": args.max_profiles,
-            "require_email": args.require_email,
-            "output_format": args.output_format,
-            "output_dir": args.output_dir
-        }
-        
-        # Create a temporary config file
-        fd, temp_config_path = tempfile.mkstemp(suffix='.json')
-        with os.fdopen(fd, 'w') as f:
-            json.dump(config, f, indent=4)
-        
-        args.config = temp_config_path
-    
     try:
-        # Initialize and run the parser
-        parser = TikTokParser(args.config)
-        results = parser.run(args.topics)
+        # Initialize the parser from the config file, or from the command line arguments
+        if args.config:
+            parser = TikTokParser(args.config)
+        else:
+            parser = TikTokParser.from_dict({
+                "apify_api_token": api_token,
+                "tiktok_actor_id": "clockworks/tiktok-scraper",
+                "profile_actor_id": "clockworks/tiktok-profile-scraper",
+                "results_per_hashtag": args.results_per_hashtag,
+                "max_profiles_per_topic": args.max_profiles,
+                "require_email": args.require_email,
+                "output_format": args.output_format,
+                "output_dir": args.output_dir,
+                "cache_ttl_hours": args.cache_ttl
+            })
+        
+        # Run the parser
+        results = asyncio.run(parser.run_async(args.topics))
         
         # Print summary
         total_profiles = sum(len(profiles) for profiles in results.values())
@@ -100,13 +95,6 @@ def main():
     except Exception as e:
         logging.error(f"Error running TikTok parser: {e}")
         sys.exit(1)
-    finally:
-        # Clean up temporary config file if created
-        if not args.config and 'temp_config_path' in locals():
-            try:
-                os.remove(temp_config_path)
-            except:
-                pass
 
 if __name__ == '__main__':
     main()
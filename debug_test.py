@@ -4,7 +4,6 @@ Test script for TikTok Parser with debug logging for followers and likes
 
 import os
 import logging
-import json
 import sys
 
 # Add the parent directory to the Python path
@@ -18,6 +17,7 @@ from src.data_processor import DataProcessor
 from src.email_extractor import EmailExtractor
 from src.data_filter import DataFilter
 from src.data_exporter import DataExporter
+from src.json_utils import dumps_pretty
 
 # Configure logging
 logging.basicConfig(
@@ -66,16 +66,16 @@ def main():
     profile_data = profile_processor.get_profile_data(usernames_list)
     
     # Save raw API response for inspection
-    with open(f"{output_dir}/raw_api_response.json", "w") as f:
-        json.dump(profile_data, f, indent=2)
+    with open(f"{output_dir}/raw_api_response.json", "w", encoding="utf-8") as f:
+        f.write(dumps_pretty(profile_data))
     print(f"Saved raw API response to {output_dir}/raw_api_response.json")
     
     # Step 3: Process profile data
     processed_profiles = data_processor.process_profile_data(profile_data, test_topic)
     
     # Save processed data for inspection
-    with open(f"{output_dir}/processed_profiles.json", "w") as f:
-        json.dump(processed_profiles, f, indent=2)
+    with open(f"{output_dir}/processed_profiles.json", "w", encoding="utf-8") as f:
+        f.write(dumps_pretty(processed_profiles))
     print(f"Saved processed profiles to {output_dir}/processed_profiles.json")
     
     # Step 4: Apply email filter
@@ -2,6 +2,7 @@
 Email Filter Module - Filters TikTok profiles based on email availability
 """
 
+import bisect
 import re
 import logging
 
@@ -24,7 +25,9 @@ class EmailFilter:
             domain_filter (list, optional): List of email domains to filter by
         """
         self.domain_filter = domain_filter or []
+        self._domain_set = frozenset(d.lower() for d in self.domain_filter)
         self.email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+        self._email_re = re.compile(self.email_pattern)
     
     def extract_email(self, text):
         """
@@ -36,14 +39,40 @@ class EmailFilter:
         Returns:
             str: Extracted email address or empty string if none found
         """
-        if not text:
+        if not text or '@' not in text:
             return ""
             
-        # Find all matches
-        matches = re.findall(self.email_pattern, text)
-        
         # Return first match or empty string
-        return matches[0] if matches else ""
+        match = self._email_re.search(text)
+        return match.group(0) if match else ""
+    
+    def extract_emails_batch(self, texts):
+        """
+        Extract the first email address from each of many texts in a single regex pass
+        
+        Args:
+            texts (list): List of texts to extract emails from (e.g., user bios)
+            
+        Returns:
+            list: Extracted email address or empty string for each text, in order
+        """
+        texts = [text or "" for text in texts]
+        emails = [""] * len(texts)
+        
+        # Offset of each text in the joined buffer
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        
+        # The pattern can't match a newline, so a match never spans two texts
+        for match in self._email_re.finditer("\n".join(texts)):
+            index = bisect.bisect_right(starts, match.start()) - 1
+            if not emails[index]:
+                emails[index] = match.group(0)
+        
+        return emails
     
     def validate_email(self, email):
         """
@@ -59,13 +88,13 @@ class EmailFilter:
             return False
             
         # Check if email matches pattern
-        if not re.match(self.email_pattern, email):
+        if not self._email_re.match(email):
             return False
             
         # If domain filter is set, check if email domain is in the filter
-        if self.domain_filter:
+        if self._domain_set:
             domain = email.split('@')[-1].lower()
-            return domain in [d.lower() for d in self.domain_filter]
+            return domain in self._domain_set
             
         return True
     
@@ -81,15 +110,24 @@ class EmailFilter:
         """
         filtered_profiles = []
         
+        # Extract emails in one batch for profiles that don't have one yet
+        pending = []
+        for profile in profiles:
+            if ('email' not in profile or not profile['email']) and 'bio' in profile:
+                # Most bios have no '@' at all; skip the regex for those
+                if '@' in (profile['bio'] or ''):
+                    pending.append(profile)
+                else:
+                    profile['email'] = ''
+                    profile['has_email'] = 0
+        
+        for profile, email in zip(pending, self.extract_emails_batch([p['bio'] for p in pending])):
+            profile['email'] = email
+            profile['has_email'] = 1 if email else 0
+        
         for profile in profiles:
-            # Extract email if not already present
-            if 'email' not in profile or not profile['email']:
-                if 'bio' in profile:
-                    profile['email'] = self.extract_email(profile['bio'])
-                    profile['has_email'] = bool(profile['email'])
-            
             # Check if profile has a valid email
-            if profile.get('has_email', False) and self.validate_email(profile.get('email', '')):
+            if profile.get('has_email', 0) and self.validate_email(profile.get('email', '')):
                 filtered_profiles.append(profile)
         
         logger.info(f"Filtered {len(filtered_profiles)} profiles with valid emails out of {len(profiles)} total profiles")
@@ -103,4 +141,5 @@ class EmailFilter:
             domains (list): List of email domains to filter by
         """
         self.domain_filter = domains
+        self._domain_set = frozenset(d.lower() for d in (domains or []))
         logger.info(f"Updated domain filter: {domains}")
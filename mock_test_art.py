@@ -11,6 +11,43 @@ from pathlib import Path
 # Add parent directory to path to allow importing from src
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Sample 'art' profiles, built once at import; callers get fresh copies
+_ART_PROFILES = (
+    {
+        'username': 'artmaster123',
+        'display_name': 'Art Master',
+        'profile_url': 'https://www.tiktok.com/@artmaster123',
+        'bio': 'Professional artist sharing tips and tricks. Contact me at artmaster@example.com for commissions.',
+        'followers': 250000,
+        'following': 1200,
+        'likes': 3500000,
+        'email': 'artmaster@example.com',
+        'has_email': 1
+    },
+    {
+        'username': 'paintingpro',
+        'display_name': 'Painting Pro',
+        'profile_url': 'https://www.tiktok.com/@paintingpro',
+        'bio': 'Oil painting specialist. DM for business inquiries or email: pro@paintingexamples.com',
+        'followers': 120000,
+        'following': 850,
+        'likes': 1800000,
+        'email': 'pro@paintingexamples.com',
+        'has_email': 1
+    },
+    {
+        'username': 'sketchdaily',
+        'display_name': 'Daily Sketch',
+        'profile_url': 'https://www.tiktok.com/@sketchdaily',
+        'bio': 'Posting a new sketch every day! Business: sketches@artmail.com',
+        'followers': 75000,
+        'following': 450,
+        'likes': 950000,
+        'email': 'sketches@artmail.com',
+        'has_email': 1
+    }
+)
+
 # Create a simple mock implementation for demonstration
 class MockTikTokParser:
     """Mock implementation of TikTok Parser for demonstration"""
@@ -42,41 +79,7 @@ class MockTikTokParser:
     def _generate_sample_profiles(self, topic):
         """Generate sample profiles for demonstration"""
         if topic == "art":
-            return [
-                {
-                    'username': 'artmaster123',
-                    'display_name': 'Art Master',
-                    'profile_url': 'https://www.tiktok.com/@artmaster123',
-                    'bio': 'Professional artist sharing tips and tricks. Contact me at artmaster@example.com for commissions.',
-                    'followers': 250000,
-                    'following': 1200,
-                    'likes': 3500000,
-                    'email': 'artmaster@example.com',
-                    'has_email': True
-                },
-                {
-                    'username': 'paintingpro',
-                    'display_name': 'Painting Pro',
-                    'profile_url': 'https://www.tiktok.com/@paintingpro',
-                    'bio': 'Oil painting specialist. DM for business inquiries or email: pro@paintingexamples.com',
-                    'followers': 120000,
-                    'following': 850,
-                    'likes': 1800000,
-                    'email': 'pro@paintingexamples.com',
-                    'has_email': True
-                },
-                {
-                    'username': 'sketchdaily',
-                    'display_name': 'Daily Sketch',
-                    'profile_url': 'https://www.tiktok.com/@sketchdaily',
-                    'bio': 'Posting a new sketch every day! Business: sketches@artmail.com',
-                    'followers': 75000,
-                    'following': 450,
-                    'likes': 950000,
-                    'email': 'sketches@artmail.com',
-                    'has_email': True
-                }
-            ]
+            return [dict(profile) for profile in _ART_PROFILES]
         else:
             # Generic sample for other topics
             return [
@@ -89,7 +92,7 @@ class MockTikTokParser:
                     'following': 500,
                     'likes': 1500000,
                     'email': f'{topic}creator@example.com',
-                    'has_email': True
+                    'has_email': 1
                 }
             ]
 
@@ -117,28 +120,32 @@ async def test_art_topic():
         # Run parser
         results = await parser.run("art")
         
-        # Print results summary
-        print("\n=== TikTok Parser Test Results for 'art' ===")
+        # Collect the results summary and write it in one go instead of flushing line by line
+        out = []
+        out.append("\n=== TikTok Parser Test Results for 'art' ===")
         for topic, profiles in results['results'].items():
-            print(f"\nTopic: {topic}")
-            print(f"  Profiles found: {len(profiles)}")
-            print(f"  Profiles with email: {sum(1 for p in profiles if p.get('has_email', False))}")
+            out.append(f"\nTopic: {topic}")
+            out.append(f"  Profiles found: {len(profiles)}")
+            out.append(f"  Profiles with email: {sum(p.get('has_email', 0) for p in profiles)}")
             
-            # Print all profile data
-            print("\n  Profile Data:")
+            # Collect all profile data
+            out.append("\n  Profile Data:")
             for i, profile in enumerate(profiles):
-                print(f"\n    Profile {i+1}:")
-                print(f"      Username: {profile.get('username', 'N/A')}")
-                print(f"      Display Name: {profile.get('display_name', 'N/A')}")
-                print(f"      Followers: {profile.get('followers', 'N/A')}")
-                print(f"      Likes: {profile.get('likes', 'N/A')}")
-                print(f"      Email: {profile.get('email', 'N/A')}")
-                print(f"      Bio: {profile.get('bio', 'N/A')[:100]}..." if len(profile.get('bio', '')) > 100 else f"      Bio: {profile.get('bio', 'N/A')}")
+                out.append(f"\n    Profile {i+1}:")
+                out.append(f"      Username: {profile.get('username', 'N/A')}")
+                out.append(f"      Display Name: {profile.get('display_name', 'N/A')}")
+                out.append(f"      Followers: {profile.get('followers', 'N/A')}")
+                out.append(f"      Likes: {profile.get('likes', 'N/A')}")
+                out.append(f"      Email: {profile.get('email', 'N/A')}")
+                out.append(f"      Bio: {profile.get('bio', 'N/A')[:100]}..." if len(profile.get('bio', '')) > 100 else f"      Bio: {profile.get('bio', 'N/A')}")
         
-        print("\n=== Exported Files ===")
+        out.append("\n=== Exported Files ===")
         for topic, filepath in results['export_by_topic'].items():
-            print(f"  {topic}: {filepath}")
-        print(f"\nCombined export: {results['export_combined']}")
+            out.append(f"  {topic}: {filepath}")
+        out.append(f"\nCombined export: {results['export_combined']}")
+        
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
         
         print("\nTest completed successfully")
         return results
@@ -5,14 +5,50 @@ Profile Extractor Module - Extracts profile data from TikTok user profiles
 import asyncio
 import logging
 import re
+import unicodedata
 from urllib.parse import urljoin
 
+try:
+    # google-re2 matches in linear time, with no catastrophic backtracking on long or hostile bios
+    import re2 as _email_re_engine
+except ImportError:
+    _email_re_engine = re
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger('profile_extractor')
 
+# Email regex pattern, compiled once at import (with re2 when it is installed)
+_EMAIL_RE = _email_re_engine.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+# Zero-width characters that split emails in bios without being visible
+_ZERO_WIDTH_TABLE = str.maketrans('', '', '\u200b\u200c\u200d\u2060\ufeff')
+
+# Count text such as "1.5M", "500K" or "1,200", and the multiplier for each suffix
+_COUNT_RE = re.compile(r'^\s*([\d.,]+)\s*([KMB])?\s*$')
+_COUNT_MULTIPLIERS = {None: 1, 'K': 1000, 'M': 1000000, 'B': 1000000000}
+
+# Selectors for the profile fields, read in a single page.evaluate round trip
+_PROFILE_SELECTORS = {
+    'display_name': 'h1[data-e2e="user-subtitle"], h2[data-e2e="user-title"]',
+    'bio': 'h2[data-e2e="user-bio"], div[data-e2e="user-bio"]',
+    'followers': 'strong[data-e2e="followers-count"], div[data-e2e="followers-count"]',
+    'following': 'strong[data-e2e="following-count"], div[data-e2e="following-count"]',
+    'likes': 'strong[data-e2e="likes-count"], div[data-e2e="likes-count"]',
+}
+
+# Returns the inner text of the first match for each selector, or null when absent
+_PROFILE_FIELDS_JS = """selectors => {
+    const fields = {};
+    for (const [name, selector] of Object.entries(selectors)) {
+        const element = document.querySelector(selector);
+        fields[name] = element ? element.innerText : null;
+    }
+    return fields;
+}"""
+
 class ProfileExtractor:
     """
     Extracts profile data from TikTok user profiles including account details and metrics
@@ -27,14 +63,17 @@ class ProfileExtractor:
         """
         self.browser_manager = browser_manager
         self.base_url = "https://www.tiktok.com"
-        self.request_delay = self.browser_manager.config.get('request_delay', 2)
+        config = self.browser_manager.config
+        self.request_delay = config.get('request_delay', 2)
+        self.max_concurrency = config.get('max_concurrency', 8)
     
-    async def extract_profile_data(self, profile_url):
+    async def extract_profile_data(self, profile_url, page=None):
         """
         Extract data from a TikTok profile
         
         Args:
             profile_url (str): URL of the profile to extract data from
+            page (Page, optional): Page to load the profile in; defaults to the browser manager's main page
             
         Returns:
             dict: Dictionary containing profile data
@@ -42,38 +81,25 @@ class ProfileExtractor:
         logger.info(f"Extracting data from profile: {profile_url}")
         
         # Navigate to profile page
-        page = await self.browser_manager.navigate(profile_url)
+        page = await self.browser_manager.navigate(profile_url, page)
         
-        # Handle login popup if it appears
-        await self.browser_manager.handle_login_popup()
+        # Handle login popup if it appears and hasn't already been dismissed in this page's context
+        if not self.browser_manager.login_popup_handled(page):
+            await self.browser_manager.handle_login_popup(page)
         
         # Extract profile data
         try:
             # Extract username from URL
             username = profile_url.split('/@')[-1].split('?')[0]
             
-            # Extract display name
-            display_name_element = await page.query_selector('h1[data-e2e="user-subtitle"], h2[data-e2e="user-title"]')
-            display_name = await display_name_element.inner_text() if display_name_element else username
-            
-            # Extract bio/description
-            bio_element = await page.query_selector('h2[data-e2e="user-bio"], div[data-e2e="user-bio"]')
-            bio = await bio_element.inner_text() if bio_element else ""
-            
-            # Extract follower count
-            followers_element = await page.query_selector('strong[data-e2e="followers-count"], div[data-e2e="followers-count"]')
-            followers_text = await followers_element.inner_text() if followers_element else "0"
-            followers = self._parse_count(followers_text)
+            # Read all profile fields in one round trip to the browser
+            fields = await page.evaluate(_PROFILE_FIELDS_JS, _PROFILE_SELECTORS)
             
-            # Extract following count
-            following_element = await page.query_selector('strong[data-e2e="following-count"], div[data-e2e="following-count"]')
-            following_text = await following_element.inner_text() if following_element else "0"
-            following = self._parse_count(following_text)
-            
-            # Extract likes count
-            likes_element = await page.query_selector('strong[data-e2e="likes-count"], div[data-e2e="likes-count"]')
-            likes_text = await likes_element.inner_text() if likes_element else "0"
-            likes = self._parse_count(likes_text)
+            display_name = fields['display_name'] or username
+            bio = fields['bio'] or ""
+            followers = self._parse_count(fields['followers'] or "0")
+            following = self._parse_count(fields['following'] or "0")
+            likes = self._parse_count(fields['likes'] or "0")
             
             # Extract email from bio using regex
             email = self._extract_email(bio)
@@ -88,7 +114,7 @@ class ProfileExtractor:
                 'following': following,
                 'likes': likes,
                 'email': email,
-                'has_email': bool(email)
+                'has_email': 1 if email else 0
             }
             
             logger.info(f"Successfully extracted data for profile: {username}")
@@ -96,33 +122,55 @@ class ProfileExtractor:
             
         except Exception as e:
             logger.error(f"Error extracting profile data: {e}")
-            return {
-                'username': profile_url.split('/@')[-1].split('?')[0],
-                'profile_url': profile_url,
-                'error': str(e)
-            }
+            return self._error_profile(profile_url, e)
     
     async def extract_multiple_profiles(self, profile_urls):
         """
-        Extract data from multiple TikTok profiles
+        Extract data from multiple TikTok profiles concurrently
         
         Args:
             profile_urls (list): List of profile URLs to extract data from
             
         Returns:
-            list: List of dictionaries containing profile data
+            list: List of dictionaries containing profile data, in the order of profile_urls
         """
-        profiles_data = []
+        semaphore = asyncio.Semaphore(self.max_concurrency)
         
-        for url in profile_urls:
-            profile_data = await self.extract_profile_data(url)
-            profiles_data.append(profile_data)
-            
-            # Add delay between profile extractions to avoid rate limiting
-            await asyncio.sleep(self.request_delay)
+        async def extract_one(url):
+            # Each profile gets its own page; navigations are still spaced by the
+            # browser manager's request_delay to avoid rate limiting
+            async with semaphore:
+                async with self.browser_manager.acquire_page() as page:
+                    return await self.extract_profile_data(url, page)
+        
+        results = await asyncio.gather(*(extract_one(url) for url in profile_urls), return_exceptions=True)
+        
+        profiles_data = []
+        for url, result in zip(profile_urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error extracting profile data: {result}")
+                result = self._error_profile(url, result)
+            profiles_data.append(result)
         
         return profiles_data
     
+    def _error_profile(self, profile_url, error):
+        """
+        Build the placeholder profile entry returned when extraction fails
+        
+        Args:
+            profile_url (str): URL of the profile that failed
+            error (Exception): The error raised during extraction
+            
+        Returns:
+            dict: Dictionary with the username, profile URL and error message
+        """
+        return {
+            'username': profile_url.split('/@')[-1].split('?')[0],
+            'profile_url': profile_url,
+            'error': str(error)
+        }
+    
     def _parse_count(self, count_text):
         """
         Parse count text (e.g., "1.5M", "500K", "1,200") to integer
@@ -133,27 +181,13 @@ class ProfileExtractor:
         Returns:
             int: Parsed count as integer
         """
+        match = _COUNT_RE.match(count_text)
+        if not match:
+            return 0
+        
         try:
-            # Remove commas
-            count_text = count_text.replace(',', '')
-            
-            # Handle K (thousands)
-            if 'K' in count_text:
-                return int(float(count_text.replace('K', '')) * 1000)
-            
-            # Handle M (millions)
-            elif 'M' in count_text:
-                return int(float(count_text.replace('M', '')) * 1000000)
-            
-            # Handle B (billions)
-            elif 'B' in count_text:
-                return int(float(count_text.replace('B', '')) * 1000000000)
-            
-            # Handle plain numbers
-            else:
-                return int(float(count_text))
-                
-        except Exception:
+            return int(float(match.group(1).replace(',', '')) * _COUNT_MULTIPLIERS[match.group(2)])
+        except ValueError:
             return 0
     
     def _extract_email(self, text):
@@ -168,12 +202,11 @@ class ProfileExtractor:
         """
         if not text:
             return ""
-            
-        # Email regex pattern
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        
-        # Find all matches
-        matches = re.findall(email_pattern, text)
         
+        # Fold look-alikes such as fullwidth "＠" or NBSP to their ASCII forms and drop
+        # zero-width characters so they don't break up the address
+        text = unicodedata.normalize('NFKC', text).translate(_ZERO_WIDTH_TABLE)
+            
         # Return first match or empty string
-        return matches[0] if matches else ""
+        match = _EMAIL_RE.search(text)
+        return match.group(0) if match else ""
@@ -12,12 +12,15 @@ setup(
     packages=find_packages(),
     install_requires=[
         "playwright>=1.20.0",
-        "asyncio>=3.4.3",
     ],
+    extras_require={
+        # Faster JSON export; the standard library json module is used without it
+        "fast": ["orjson>=3.0"],
+    },
     entry_points={
         "console_scripts": [
             "tiktok-parser=cli:main",
         ],
     },
-    python_requires=">=3.7",
+    python_requires=">=3.9",
 )
@@ -3,8 +3,8 @@ API Client Module - Handles interaction with the Apify API
 """
 
 import logging
-import time
-from typing import Dict, List, Any, Optional, Union
+import threading
+from typing import Dict, List, Any, Optional, Union, Iterator
 
 from apify_client import ApifyClient
 
@@ -29,10 +29,15 @@ class ApiClient:
         self.tiktok_actor_id = tiktok_actor_id
         self.profile_actor_id = profile_actor_id
         self.client = ApifyClient(api_token)
+        # Detailed profile items already fetched in this process, keyed by username
+        self._profile_cache: Dict[str, List[Dict[str, Any]]] = {}
+        # Fetches in progress, keyed by username; the event is set when the fetch finishes
+        self._profile_fetches: Dict[str, threading.Event] = {}
+        self._profile_lock = threading.Lock()
         logger.info(f"Initialized ApiClient with topic actor ID: {tiktok_actor_id} and profile actor ID: {profile_actor_id}")
         
     def run_actor_with_input(self, actor_id: str, input_data: Dict[str, Any], wait_for_finish: bool = True, 
-                            timeout_secs: int = 300) -> Optional[str]:
+                            timeout_secs: Optional[int] = None) -> Optional[str]:
         """
         Runs an Apify Actor with the provided input.
         
@@ -40,54 +45,54 @@ class ApiClient:
             actor_id (str): ID of the Actor to run
             input_data (Dict[str, Any]): Input data for the Actor
             wait_for_finish (bool): Whether to wait for the Actor run to finish
-            timeout_secs (int): Maximum time to wait for the Actor run to finish
+            timeout_secs (Optional[int]): Maximum time to wait for the Actor run to finish
+                (None waits until it finishes)
             
         Returns:
-            Optional[str]: Run ID if successful, None otherwise
+            Optional[str]: Run ID if successful (or started, when not waiting), None otherwise
         """
         try:
             logger.info(f"Starting Actor run with input: {input_data}")
-            run = self.client.actor(actor_id).call(run_input=input_data)
+            actor = self.client.actor(actor_id)
             
             if not wait_for_finish:
+                run = actor.start(run_input=input_data)
                 return run.get("id")
                 
-            # Wait for the run to finish
-            start_time = time.time()
-            while True:
-                run_info = self.client.run(run.get("id")).get()
-                status = run_info.get("status")
+            # Let the API server wait for the run to finish instead of polling its status
+            run = actor.call(run_input=input_data, wait_secs=timeout_secs)
+            if not run:
+                logger.error("Actor run could not be retrieved")
+                return None
                 
-                if status == "SUCCEEDED":
-                    logger.info(f"Actor run succeeded. Run ID: {run.get('id')}")
-                    return run.get("id")
-                    
-                elif status in ["FAILED", "ABORTED", "TIMED-OUT"]:
-                    logger.error(f"Actor run failed with status: {status}")
-                    return None
-                    
-                # Check timeout
-                if time.time() - start_time > timeout_secs:
-                    logger.warning(f"Timeout waiting for Actor run to finish after {timeout_secs} seconds")
-                    return run.get("id")  # Return the ID anyway so caller can check status later
-                    
-                # Wait before checking again
-                time.sleep(5)
+            status = run.get("status")
+            if status == "SUCCEEDED":
+                logger.info(f"Actor run succeeded. Run ID: {run.get('id')}")
+                return run.get("id")
+                
+            elif status in ["FAILED", "ABORTED", "TIMED-OUT"]:
+                logger.error(f"Actor run failed with status: {status}")
+                return None
+                
+            # Still running (e.g. after timeout_secs); its dataset is incomplete, so don't hand it out
+            logger.error(f"Actor run {run.get('id')} did not finish (status: {status})")
+            return None
                 
         except Exception as e:
             logger.error(f"Error running Actor: {e}")
             return None
             
-    def get_dataset_items(self, run_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def iter_dataset_items(self, run_id: str, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
         """
-        Retrieves dataset items from a completed Actor run.
+        Streams dataset items from a completed Actor run, fetching them page by page
+        so the full dataset is never held in memory at once.
         
         Args:
             run_id (str): ID of the Actor run
             limit (Optional[int]): Maximum number of items to retrieve
             
-        Returns:
-            List[Dict[str, Any]]: List of dataset items
+        Yields:
+            Dict[str, Any]: Dataset items, one at a time
         """
         try:
             logger.info(f"Retrieving dataset items for run ID: {run_id}")
@@ -98,35 +103,43 @@ class ApiClient:
             
             if not dataset_id:
                 logger.error(f"No default dataset found for run ID: {run_id}")
-                return []
+                return
                 
-            # Get dataset items
-            items = []
-            options = {}
-            if limit:
-                options["limit"] = limit
+            count = 0
+            for item in self.client.dataset(dataset_id).iterate_items(limit=limit or None):
+                count += 1
+                yield item
                 
-            dataset_items = self.client.dataset(dataset_id).list_items(**options)
-            # Access items directly from the ListPage object
-            items.extend(dataset_items.items)
-            
-            logger.info(f"Retrieved {len(items)} dataset items")
-            return items
+            logger.info(f"Retrieved {count} dataset items")
             
         except Exception as e:
             logger.error(f"Error retrieving dataset items: {e}")
-            return []
             
-    def search_by_hashtag(self, hashtag: str, results_per_page: int = 100) -> List[Dict[str, Any]]:
+    def get_dataset_items(self, run_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Searches TikTok for videos with the specified hashtag using the TikTok Scraper API.
+        Retrieves dataset items from a completed Actor run.
+        
+        Args:
+            run_id (str): ID of the Actor run
+            limit (Optional[int]): Maximum number of items to retrieve
+            
+        Returns:
+            List[Dict[str, Any]]: List of dataset items
+        """
+        return list(self.iter_dataset_items(run_id, limit))
+        
+    def iter_search_by_hashtag(self, hashtag: str, results_per_page: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Searches TikTok for videos with the specified hashtag using the TikTok Scraper API,
+        streaming the results page by page. Pages past the point where the caller stops
+        iterating are never downloaded.
         
         Args:
             hashtag (str): Hashtag to search for (without the # symbol)
             results_per_page (int): Number of results to retrieve
             
-        Returns:
-            List[Dict[str, Any]]: List of video data items
+        Yields:
+            Dict[str, Any]: Video data items, one at a time
         """
         input_data = {
             "hashtags": [hashtag],
@@ -137,9 +150,22 @@ class ApiClient:
         
         run_id = self.run_actor_with_input(self.tiktok_actor_id, input_data)
         if not run_id:
-            return []
+            return
             
-        return self.get_dataset_items(run_id)
+        yield from self.iter_dataset_items(run_id)
+        
+    def search_by_hashtag(self, hashtag: str, results_per_page: int = 100) -> List[Dict[str, Any]]:
+        """
+        Searches TikTok for videos with the specified hashtag using the TikTok Scraper API.
+        
+        Args:
+            hashtag (str): Hashtag to search for (without the # symbol)
+            results_per_page (int): Number of results to retrieve
+            
+        Returns:
+            List[Dict[str, Any]]: List of video data items
+        """
+        return list(self.iter_search_by_hashtag(hashtag, results_per_page))
         
     def get_profiles(self, usernames: List[str], results_per_profile: int = 1) -> List[Dict[str, Any]]:
         """
@@ -168,7 +194,9 @@ class ApiClient:
     def get_detailed_profiles(self, usernames: List[str]) -> List[Dict[str, Any]]:
         """
         Retrieves detailed profile data including followers and likes for the specified TikTok usernames
-        using the TikTok Profile Scraper API.
+        using the TikTok Profile Scraper API. Profiles already fetched by this client (e.g. for an
+        earlier topic) are served from memory, and profiles another thread is fetching right now are
+        waited for, so only the remaining usernames are sent to the Actor.
         
         Args:
             usernames (List[str]): List of TikTok usernames
@@ -176,6 +204,55 @@ class ApiClient:
         Returns:
             List[Dict[str, Any]]: List of detailed profile data items
         """
+        unique_usernames = list(dict.fromkeys(usernames))
+        
+        # Claim the usernames nobody has fetched or is fetching; note the fetches to wait for
+        fetch_done = threading.Event()
+        with self._profile_lock:
+            cached = [username for username in unique_usernames if username in self._profile_cache]
+            in_flight = {self._profile_fetches[username] for username in unique_usernames
+                         if username in self._profile_fetches}
+            missing = [username for username in unique_usernames
+                       if username not in self._profile_cache and username not in self._profile_fetches]
+            for username in missing:
+                self._profile_fetches[username] = fetch_done
+                
+        if cached:
+            logger.info(f"Reusing cached profile data for {len(cached)} usernames")
+        if in_flight:
+            logger.info(f"Waiting for {len(in_flight)} profile fetches already in progress")
+            
+        # Items that can't be matched to a requested username are only returned to this caller
+        unmatched = []
+        if missing:
+            try:
+                unmatched = self._fetch_detailed_profiles(missing)
+            finally:
+                with self._profile_lock:
+                    for username in missing:
+                        del self._profile_fetches[username]
+                fetch_done.set()
+                
+        for event in in_flight:
+            event.wait()
+            
+        with self._profile_lock:
+            results = [item for username in unique_usernames
+                       for item in self._profile_cache.get(username, ())]
+        results.extend(unmatched)
+        return results
+        
+    def _fetch_detailed_profiles(self, usernames: List[str]) -> List[Dict[str, Any]]:
+        """
+        Runs the TikTok Profile Scraper for the given usernames and stores the returned items in the
+        profile cache, keyed by username.
+        
+        Args:
+            usernames (List[str]): List of TikTok usernames
+            
+        Returns:
+            List[Dict[str, Any]]: Items whose username is missing or not one of the requested usernames
+        """
         input_data = {
             "profiles": usernames,
             "resultsPerPage": 1,  # We only need basic profile info
@@ -189,7 +266,18 @@ class ApiClient:
         if not run_id:
             return []
             
-        return self.get_dataset_items(run_id)
+        requested = set(usernames)
+        unmatched = []
+        for item in self.iter_dataset_items(run_id):
+            author_meta = item.get("authorMeta")
+            username = author_meta.get("name") if isinstance(author_meta, dict) else None
+            if username in requested:
+                with self._profile_lock:
+                    self._profile_cache.setdefault(username, []).append(item)
+            else:
+                unmatched.append(item)
+                
+        return unmatched
 
 # Example usage (for testing purposes)
 if __name__ == '__main__':
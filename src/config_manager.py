@@ -5,6 +5,7 @@ Configuration Manager Module - Handles loading and providing configuration
 import os
 import json
 import logging
+from typing import Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -13,19 +14,24 @@ class ConfigManager:
     Manages loading configuration from environment variables or a config file.
     """
     
-    def __init__(self, config_file_path="config.json"):
+    # Parsed config files shared by all instances, keyed by (absolute path, modification time)
+    _CACHE: Dict[Tuple[str, float], dict] = {}
+    
+    def __init__(self, config_file_path="config.json", config=None):
         """
         Initializes the ConfigManager.
         
         Args:
             config_file_path (str): Path to the JSON configuration file.
+            config (dict, optional): Configuration values to use instead of reading the config file.
         """
         self.config_file_path = config_file_path
-        self.config = self._load_config()
+        self.config = self._load_config(config)
         
-    def _load_config(self):
+    def _load_config(self, overrides=None):
         """
-        Loads configuration, prioritizing environment variables over config file.
+        Loads configuration, prioritizing environment variables over the config file
+        (or over the given overrides, in which case the config file is not read).
         """
         config = {
             # --- Apify Settings ---
@@ -40,17 +46,19 @@ class ConfigManager:
             "require_email": True,
             
             # --- Output Settings ---
-            "output_format": "csv", # csv or json
-            "output_dir": "./output_api"
+            "output_format": "csv", # csv, json or jsonl
+            "output_dir": "./output_api",
+            
+            # --- Cache Settings ---
+            "cache_ttl_hours": 0 # How long Apify results are reused across runs (0 disables the cache)
         }
         
-        # 1. Load from config file if it exists
-        if os.path.exists(self.config_file_path):
+        # 1. Load from the given dictionary, or from the config file if it exists
+        if overrides is not None:
+            config.update(overrides)
+        elif os.path.exists(self.config_file_path):
             try:
-                with open(self.config_file_path, 'r') as f:
-                    file_config = json.load(f)
-                    config.update(file_config)
-                    logger.info(f"Loaded configuration from {self.config_file_path}")
+                config.update(self._read_config_file())
             except Exception as e:
                 logger.warning(f"Could not load config file {self.config_file_path}: {e}")
         
@@ -73,6 +81,23 @@ class ConfigManager:
             
         return config
 
+    def _read_config_file(self):
+        """
+        Reads and parses the config file, reusing the parsed result while the file is unchanged.
+        
+        Returns:
+            dict: A copy of the configuration from the file.
+        """
+        path = os.path.abspath(self.config_file_path)
+        key = (path, os.path.getmtime(path))
+        
+        if key not in self._CACHE:
+            with open(path, 'r') as f:
+                self._CACHE[key] = json.load(f)
+            logger.info(f"Loaded configuration from {self.config_file_path}")
+        
+        return dict(self._CACHE[key])
+
     def get(self, key, default=None):
         """
         Retrieves a configuration value.
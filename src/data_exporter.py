@@ -3,16 +3,24 @@ Data Exporter Module - Exports processed data to files
 """
 
 import csv
-import json
+import itertools
 import logging
 import os
-from typing import List, Dict, Any
+from typing import Dict, Any, Iterable, Optional, Sequence, Set
+
+from .json_utils import dumps_line, dumps_pretty_bytes
 
 logger = logging.getLogger(__name__)
 
+# Column order of the influencer profiles produced by DataProcessor and DataFilter
+CSV_FIELDS = (
+    "topic", "username", "profile_url", "followers", "likes", "following",
+    "friends", "video_count", "bio", "email", "has_email"
+)
+
 class DataExporter:
     """
-    Exports the final, filtered influencer data to CSV or JSON files.
+    Exports the final, filtered influencer data to CSV, JSON or JSON Lines files.
     """
     
     def __init__(self, output_dir: str = "./output_api"):
@@ -23,63 +31,119 @@ class DataExporter:
             output_dir (str): Directory where output files will be saved.
         """
         self.output_dir = output_dir
-        os.makedirs(self.output_dir, exist_ok=True)
+        # Directories already created by this exporter, so repeated exports skip makedirs
+        self._ensured_dirs: Set[str] = set()
+        self._ensure_dir(self.output_dir)
         logger.info(f"Initialized DataExporter. Output directory: {self.output_dir}")
 
-    def _write_csv(self, data: List[Dict[str, Any]], filename: str):
+    def _ensure_dir(self, directory: str):
         """
-        Writes data to a CSV file.
+        Creates the directory (and parents) unless this exporter has already done so.
         """
-        if not data:
+        if directory in self._ensured_dirs:
+            return
+        os.makedirs(directory, exist_ok=True)
+        self._ensured_dirs.add(directory)
+
+    def _write_csv(self, data: Iterable[Dict[str, Any]], filename: str, fieldnames: Optional[Sequence[str]] = None):
+        """
+        Writes data to a CSV file, streaming rows as they are consumed.
+        
+        Args:
+            data (Iterable[Dict[str, Any]]): Rows to write.
+            filename (str): Name of the file inside the output directory.
+            fieldnames (Optional[Sequence[str]]): Column order; defaults to the keys of the first row.
+                Keys not listed are left out of the file.
+        """
+        rows = iter(data)
+        first_row = next(rows, None)
+        if first_row is None:
             logger.warning(f"No data to write to CSV file: {filename}")
             return
             
         filepath = os.path.join(self.output_dir, filename)
         try:
-            # Define headers based on the keys of the first item
-            headers = list(data[0].keys())
+            # Define headers based on the keys of the first item unless given
+            headers = fieldnames or list(first_row.keys())
             
-            with open(filepath, mode="w", newline="", encoding="utf-8") as file:
-                writer = csv.DictWriter(file, fieldnames=headers)
-                writer.writeheader()
-                writer.writerows(data)
-            logger.info(f"Successfully wrote {len(data)} records to CSV: {filepath}")
+            # A large write buffer flushes rows to disk in few, big chunks
+            with open(filepath, mode="w", newline="", encoding="utf-8", buffering=1 << 20) as file:
+                # Plain csv.writer on value lists avoids DictWriter's per-row key mapping
+                writer = csv.writer(file)
+                writer.writerow(headers)
+                writer.writerow([first_row.get(header) for header in headers])
+                count = 1
+                for row in rows:
+                    writer.writerow([row.get(header) for header in headers])
+                    count += 1
+            logger.info(f"Successfully wrote {count} records to CSV: {filepath}")
         except Exception as e:
             logger.error(f"Error writing CSV file {filepath}: {e}")
 
-    def _write_json(self, data: List[Dict[str, Any]], filename: str):
+    def _write_json(self, data: Iterable[Dict[str, Any]], filename: str):
         """
         Writes data to a JSON file.
         """
+        data = list(data)
         if not data:
             logger.warning(f"No data to write to JSON file: {filename}")
             return
             
         filepath = os.path.join(self.output_dir, filename)
         try:
-            with open(filepath, mode="w", encoding="utf-8") as file:
-                json.dump(data, file, indent=4, ensure_ascii=False)
+            with open(filepath, mode="wb") as file:
+                file.write(dumps_pretty_bytes(data))
             logger.info(f"Successfully wrote {len(data)} records to JSON: {filepath}")
         except Exception as e:
             logger.error(f"Error writing JSON file {filepath}: {e}")
 
-    def export_data(self, data: List[Dict[str, Any]], base_filename: str, output_format: str = "csv"):
+    def _write_jsonl(self, data: Iterable[Dict[str, Any]], filename: str):
+        """
+        Writes data to a JSON Lines file (one JSON object per line), streaming rows as they
+        are consumed.
+        """
+        rows = iter(data)
+        first_row = next(rows, None)
+        if first_row is None:
+            logger.warning(f"No data to write to JSONL file: {filename}")
+            return
+            
+        filepath = os.path.join(self.output_dir, filename)
+        try:
+            with open(filepath, mode="wb", buffering=1 << 20) as file:
+                count = 0
+                for row in itertools.chain((first_row,), rows):
+                    file.write(dumps_line(row))
+                    file.write(b"\n")
+                    count += 1
+            logger.info(f"Successfully wrote {count} records to JSONL: {filepath}")
+        except Exception as e:
+            logger.error(f"Error writing JSONL file {filepath}: {e}")
+
+    def export_data(self, data: Iterable[Dict[str, Any]], base_filename: str, output_format: str = "csv",
+                    fieldnames: Optional[Sequence[str]] = None):
         """
         Exports the data to the specified format.
         
         Args:
-            data (List[Dict[str, Any]]): The list of processed influencer data.
+            data (Iterable[Dict[str, Any]]): The processed influencer data (a list or any iterable of rows).
             base_filename (str): The base name for the output file (e.g., "topic_art" or "all_topics").
-            output_format (str): The desired output format ("csv" or "json").
+            output_format (str): The desired output format ("csv", "json" or "jsonl").
+            fieldnames (Optional[Sequence[str]]): CSV column order; defaults to the keys of the first row.
         """
         filename = f"{base_filename}.{output_format}"
         
+        # output_dir may have been changed since the exporter was created
+        self._ensure_dir(self.output_dir)
+        
         if output_format.lower() == "csv":
-            self._write_csv(data, filename)
+            self._write_csv(data, filename, fieldnames)
         elif output_format.lower() == "json":
             self._write_json(data, filename)
+        elif output_format.lower() == "jsonl":
+            self._write_jsonl(data, filename)
         else:
-            logger.error(f"Unsupported output format: {output_format}. Please use 'csv' or 'json'.")
+            logger.error(f"Unsupported output format: {output_format}. Please use 'csv', 'json' or 'jsonl'.")
 
 # Example usage (for testing purposes)
 if __name__ == '__main__':
@@ -92,13 +156,13 @@ if __name__ == '__main__':
             "topic": "testing", "username": "testuser1", "profile_url": "url1", 
             "followers": 1000, "likes": 50000, 
             "bio": "This is my bio. Contact: test@example.com", 
-            "email": "test@example.com", "has_email": True
+            "email": "test@example.com", "has_email": 1
         },
         {
             "topic": "testing", "username": "testuser3", "profile_url": "url3", 
             "followers": 500, "likes": 10000, 
             "bio": "Bio 3. Email me at user3@domain.net", 
-            "email": "user3@domain.net", "has_email": True
+            "email": "user3@domain.net", "has_email": 1
         }
     ]
     
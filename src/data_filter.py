@@ -2,8 +2,9 @@
 Data Filter Module - Filters processed influencer data based on criteria
 """
 
+import bisect
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from .email_extractor import EmailExtractor
 
@@ -23,45 +24,81 @@ class DataFilter:
             email_extractor (EmailExtractor): Instance of the EmailExtractor.
         """
         self.email_extractor = email_extractor
+        # Bound once so the batch scan avoids method dispatch and attribute lookups
+        self._email_finditer = email_extractor.EMAIL_REGEX.finditer
         logger.info("Initialized DataFilter")
 
-    def apply_email_filter(self, processed_profiles: List[Dict[str, Any]], require_email: bool = True) -> List[Dict[str, Any]]:
+    def apply_email_filter(self, processed_profiles: List[Dict[str, Any]], require_email: bool = True,
+                           extract_anyway: bool = True) -> List[Dict[str, Any]]:
         """
         Applies email extraction and filters the list of profiles.
         
         Args:
             processed_profiles (List[Dict[str, Any]]): List of processed profile data.
             require_email (bool): If True, only profiles with an extracted email are returned.
+            extract_anyway (bool): If False and require_email is False, no emails are extracted:
+                all profiles are returned with email None and has_email 0.
             
         Returns:
-            List[Dict[str, Any]]: Filtered list of profile data, with email fields updated.
+            List[Dict[str, Any]]: Filtered list of profile data, with email fields set. These are
+                new dicts; the input profiles are not modified.
         """
         if not processed_profiles:
             return []
             
         logger.info(f"Applying email filter (require_email={require_email}) to {len(processed_profiles)} profiles.")
         
-        filtered_profiles = []
-        for profile in processed_profiles:
-            # Extract email from bio
-            bio = profile.get("bio", "")
-            email = self.email_extractor.extract_email(bio)
-            
-            # Update profile data
-            profile["email"] = email
-            profile["has_email"] = bool(email)
+        # Nothing is filtered out and the caller doesn't need the emails, so skip the regex scan
+        if not require_email and not extract_anyway:
+            return [{**profile, "email": None, "has_email": 0} for profile in processed_profiles]
             
-            # Apply filter
-            if require_email:
-                if profile["has_email"]:
-                    filtered_profiles.append(profile)
-            else:
-                # If email is not required, include all profiles
-                filtered_profiles.append(profile)
+        # Extract emails from all bios in one regex scan
+        emails = self._extract_emails([profile.get("bio") or "" for profile in processed_profiles])
+        
+        filtered_profiles = []
+        append = filtered_profiles.append
+        for profile, email in zip(processed_profiles, emails):
+            # Apply filter; if email is not required, include all profiles.
+            # Only kept profiles are copied, with their email fields set.
+            if email or not require_email:
+                append({**profile, "email": email, "has_email": 1 if email else 0})
                 
         logger.info(f"Filtered profiles count: {len(filtered_profiles)}")
         return filtered_profiles
 
+    def _extract_emails(self, bios: List[str]) -> List[Optional[str]]:
+        """
+        Extracts the first email address from each bio, with the same result as calling
+        EmailExtractor.extract_email on each one.
+        
+        The bios are joined with newlines (which the email pattern cannot match across) and
+        scanned with a single finditer call; each match is mapped back to its bio through
+        the bios' start offsets.
+        
+        Args:
+            bios (List[str]): Bio texts.
+            
+        Returns:
+            List[Optional[str]]: The email found in each bio, or None.
+        """
+        # Bios without an "@" cannot contain an email; blank them so the regex never scans them
+        bios = [bio if "@" in bio else "" for bio in bios]
+        
+        starts = []
+        offset = 0
+        for bio in bios:
+            starts.append(offset)
+            offset += len(bio) + 1
+            
+        emails: List[Optional[str]] = [None] * len(bios)
+        for match in self._email_finditer("\n".join(bios)):
+            index = bisect.bisect_right(starts, match.start()) - 1
+            # Only the first match in a bio counts
+            if emails[index] is None:
+                emails[index] = match.group(0)
+                
+        return emails
+
 # Example usage (for testing purposes)
 if __name__ == '__main__':
     # Setup basic logging
@@ -73,19 +110,19 @@ if __name__ == '__main__':
             "topic": "testing", "username": "testuser1", "profile_url": "url1", 
             "followers": 1000, "likes": 50000, 
             "bio": "This is my bio. Contact: test@example.com", 
-            "email": None, "has_email": False
+            "email": None, "has_email": 0
         },
         {
             "topic": "testing", "username": "testuser2", "profile_url": "url2", 
             "followers": 2500, "likes": 120000, 
             "bio": "Another bio here.", 
-            "email": None, "has_email": False
+            "email": None, "has_email": 0
         },
         {
             "topic": "testing", "username": "testuser3", "profile_url": "url3", 
             "followers": 500, "likes": 10000, 
             "bio": "Bio 3. Email me at user3@domain.net", 
-            "email": None, "has_email": False
+            "email": None, "has_email": 0
         }
     ]
     
@@ -101,7 +138,7 @@ if __name__ == '__main__':
     # Reset email fields for next test
     for p in processed_data:
         p["email"] = None
-        p["has_email"] = False
+        p["has_email"] = 0
         
     # Test with require_email = False
     print("\nFiltering with require_email=False:")
@@ -3,9 +3,10 @@ Data Processor Module - Parses and normalizes raw API data
 """
 
 import logging
-import json
 from typing import List, Dict, Any, Optional
 
+from .json_utils import dumps_pretty
+
 logger = logging.getLogger(__name__)
 
 class DataProcessor:
@@ -31,13 +32,13 @@ class DataProcessor:
         Returns:
             Any: The value at the specified path, or the default value if not found.
         """
-        current = data
-        for key in path:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return default
-        return current
+        # One lookup per level; a missing key or a non-dict level raises instead of being pre-checked
+        try:
+            for key in path:
+                data = data[key]
+            return data
+        except (KeyError, TypeError, IndexError):
+            return default
         
     def process_profile_data(self, raw_profile_items: List[Dict[str, Any]], topic: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -56,24 +57,27 @@ class DataProcessor:
             
         logger.info(f"Processing {len(raw_profile_items)} raw profile items.")
         
+        # Only build debug messages when they will be emitted
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
         # Debug: Log the first item's structure to understand the API response format
-        if raw_profile_items and len(raw_profile_items) > 0:
-            first_item = raw_profile_items[0]
-            logger.debug(f"DEBUG - First profile item structure: {json.dumps(first_item, indent=2)}")
+        if debug_enabled:
+            logger.debug(f"DEBUG - First profile item structure: {dumps_pretty(raw_profile_items[0])}")
         
         for item in raw_profile_items:
-            # Extract username from different possible locations
-            username = None
-            
-            # Try to get username from authorMeta
-            if "authorMeta" in item:
-                username = self._safe_get(item, ["authorMeta", "name"])
-            
-            # If not found, try other possible locations
-            if not username:
-                username = (item.get("uniqueId") or 
-                           item.get("nickname") or 
-                           self._safe_get(item, ["userInfo", "user", "uniqueId"]))
+            # Look up the nested sections once per item
+            author_meta = item.get("authorMeta")
+            if not isinstance(author_meta, dict):
+                author_meta = {}
+            user_info = item.get("userInfo")
+            if not isinstance(user_info, dict):
+                user_info = {}
+            
+            # Extract username from authorMeta, falling back to other possible locations
+            username = (author_meta.get("name") or 
+                       item.get("uniqueId") or 
+                       item.get("nickname") or 
+                       self._safe_get(user_info, ["user", "uniqueId"]))
                 
             if not username:
                 logger.warning(f"Could not extract username from item: {item.get('id', 'N/A')}")
@@ -81,51 +85,19 @@ class DataProcessor:
             
             profile_url = f"https://www.tiktok.com/@{username}" if username else None
             
-            # For TikTok Profile Scraper API, followers are in "fans" and likes in "heart"
-            # These are typically in the authorMeta section
-            followers = 0
-            likes = 0
-            
-            # Try to get followers and likes from authorMeta (Profile Scraper API)
-            if "authorMeta" in item:
-                followers = self._safe_get(item, ["authorMeta", "fans"], 0)
-                likes = self._safe_get(item, ["authorMeta", "heart"], 0)
-            
-            # If not found in authorMeta, try direct properties (some API responses have them at top level)
-            if followers == 0:
-                followers = item.get("fans", 0)
-            if likes == 0:
-                likes = item.get("heart", 0)
-                
-            # If still not found, try diggCount for likes (TikTok Scraper API)
-            if likes == 0:
-                likes = item.get("diggCount", 0)
+            # For TikTok Profile Scraper API, followers are in "fans" and likes in "heart",
+            # typically in the authorMeta section; some API responses have them at top level.
+            # diggCount is the likes field of the TikTok Scraper API.
+            followers = author_meta.get("fans") or item.get("fans") or 0
+            likes = author_meta.get("heart") or item.get("heart") or item.get("diggCount") or 0
             
             # Bio might be under authorMeta or directly in item
-            bio = None
-            if "authorMeta" in item:
-                bio = self._safe_get(item, ["authorMeta", "signature"])
-            if not bio:
-                bio = item.get("signature") or self._safe_get(item, ["userInfo", "signature"], "")
-            
-            # Extract additional fields from authorMeta
-            following = 0
-            friends = 0
-            video_count = 0
-            
-            # Try to get additional fields from authorMeta (Profile Scraper API)
-            if "authorMeta" in item:
-                following = self._safe_get(item, ["authorMeta", "following"], 0)
-                friends = self._safe_get(item, ["authorMeta", "friends"], 0)
-                video_count = self._safe_get(item, ["authorMeta", "video"], 0)
+            bio = author_meta.get("signature") or item.get("signature") or user_info.get("signature") or ""
             
-            # If not found in authorMeta, try direct properties
-            if following == 0:
-                following = item.get("following", 0)
-            if friends == 0:
-                friends = item.get("friends", 0)
-            if video_count == 0:
-                video_count = item.get("video", 0)
+            # Additional fields from authorMeta (Profile Scraper API), else direct properties
+            following = author_meta.get("following") or item.get("following") or 0
+            friends = author_meta.get("friends") or item.get("friends") or 0
+            video_count = author_meta.get("video") or item.get("video") or 0
             
             processed_profile = {
                 "topic": topic,
@@ -138,11 +110,12 @@ class DataProcessor:
                 "video_count": video_count,
                 "bio": bio or "", # Ensure bio is always a string
                 "email": None, # To be filled by EmailExtractor
-                "has_email": False # To be set by EmailExtractor/DataFilter
+                "has_email": 0 # To be set by EmailExtractor/DataFilter
             }
             
             # Debug: Log the extracted data for this profile
-            logger.debug(f"DEBUG - Extracted profile data for {username}: followers={followers}, likes={likes}")
+            if debug_enabled:
+                logger.debug(f"DEBUG - Extracted profile data for {username}: followers={followers}, likes={likes}")
             
             processed_profiles.append(processed_profile)
             
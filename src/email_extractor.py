@@ -2,6 +2,7 @@
 Email Extractor Module - Identifies and extracts email addresses from text
 """
 
+import functools
 import re
 import logging
 from typing import Optional
@@ -16,12 +17,24 @@ class EmailExtractor:
     # Regex to find potential email addresses
     # Handles common formats, including those with dots, hyphens, underscores in local part
     # and common TLDs. It's not exhaustive but covers many cases.
-    EMAIL_REGEX = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+    # The lookahead right after the "@" rejects image file names (e.g. name@2x.png) as the match
+    # is made, so the search moves on to a real address instead of needing a separate suffix
+    # check. It is anchored at the "@" so backtracking can't cut the domain short before the
+    # image extension (x@foo.bar.png matching as x@foo.bar).
+    EMAIL_REGEX = re.compile(
+        r"[a-zA-Z0-9._%+-]+@(?![a-zA-Z0-9.-]*\.(?:png|jpe?g|gif|webp)(?![a-zA-Z]))[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
+        re.IGNORECASE | re.ASCII
+    )
+    
+    # Number of distinct texts whose result is remembered
+    CACHE_SIZE = 8192
 
     def __init__(self):
         """
         Initializes the EmailExtractor.
         """
+        # The same bio shows up once per video and again across topics, so remember results by text
+        self._extract_cached = functools.lru_cache(maxsize=self.CACHE_SIZE)(self._extract)
         logger.info("Initialized EmailExtractor")
 
     def extract_email(self, text: Optional[str]) -> Optional[str]:
@@ -34,21 +47,22 @@ class EmailExtractor:
         Returns:
             Optional[str]: The first email address found, or None if no email is found.
         """
-        if not text:
+        # Most bios have no "@" at all; the substring check is far cheaper than the regex
+        if not text or "@" not in text:
             return None
             
+        return self._extract_cached(text)
+
+    def _extract(self, text: str) -> Optional[str]:
+        """
+        Uncached implementation of extract_email for a non-empty text.
+        """
         try:
             match = self.EMAIL_REGEX.search(text)
             if match:
                 email = match.group(0)
-                # Basic validation: avoid common false positives like image URLs ending in .jpg/.png
-                if not email.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp')):
-                    logger.debug(f"Extracted email: {email} from text: {text[:100]}...")
-                    return email
-                else:
-                    logger.debug(f"Skipped potential false positive email: {email}")
-                    # Continue searching if needed, though this implementation returns the first match
-                    # For more complex scenarios, might need findall and further filtering
+                logger.debug(f"Extracted email: {email} from text: {text[:100]}...")
+                return email
             
         except Exception as e:
             logger.error(f"Error during email extraction: {e}")
@@ -0,0 +1,58 @@
+"""
+JSON Utilities Module - Serializes data to JSON, using orjson when it is available
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the standard library
+    orjson = None
+
+# Non-string dict keys are stringified, as the standard library does
+_ORJSON_PRETTY = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if orjson is not None else None
+
+def dumps_pretty(data: Any) -> str:
+    """
+    Serializes data to an indented (2 spaces) JSON string.
+    
+    Args:
+        data (Any): JSON-serializable data.
+        
+    Returns:
+        str: The JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=_ORJSON_PRETTY).decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+def dumps_line(data: Any) -> bytes:
+    """
+    Serializes data to a compact, single-line UTF-8 encoded JSON document, as used for
+    one record of a JSON Lines file (the trailing newline is not included).
+    
+    Args:
+        data (Any): JSON-serializable data.
+        
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def dumps_pretty_bytes(data: Any) -> bytes:
+    """
+    Serializes data to an indented (2 spaces) UTF-8 encoded JSON document, ready to be
+    written to a file opened in binary mode.
+    
+    Args:
+        data (Any): JSON-serializable data.
+        
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=_ORJSON_PRETTY)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
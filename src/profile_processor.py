@@ -2,10 +2,14 @@
 Profile Processor Module - Handles scraping detailed data for specific user profiles
 """
 
+import asyncio
+import concurrent.futures
+import itertools
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Callable
 
 from .api_client import ApiClient
+from .result_cache import ResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -14,32 +18,68 @@ class ProfileProcessor:
     Handles the logic for scraping detailed data for specific user profiles.
     """
     
-    def __init__(self, api_client: ApiClient, results_per_profile: int = 1):
+    def __init__(self, api_client: ApiClient, results_per_profile: int = 1,
+                 batch_size: int = 20, max_concurrent_batches: int = 8, cache: Optional[ResultCache] = None):
         """
         Initializes the ProfileProcessor.
         
         Args:
             api_client (ApiClient): Instance of the ApiClient for making API calls.
             results_per_profile (int): Number of results to fetch per profile (usually 1 for profile data).
+            batch_size (int): Number of usernames sent to the Profile Scraper API per actor run.
+            max_concurrent_batches (int): Maximum number of actor runs in flight at once.
+            cache (Optional[ResultCache]): If given, profile data for a batch of usernames is reused
+                from it instead of running the Profile Scraper again.
         """
         self.api_client = api_client
         self.results_per_profile = results_per_profile
+        self.batch_size = batch_size
+        self.max_concurrent_batches = max_concurrent_batches
+        self.cache = cache
         
     def get_profile_data(self, usernames: List[str]) -> List[Dict[str, Any]]:
         """
         Retrieves detailed profile data for a list of usernames using the TikTok Profile Scraper API.
         This API provides complete profile data including followers ("fans") and likes ("heart").
         
+        Lists longer than batch_size are split into batches that are fetched in parallel
+        threads, up to max_concurrent_batches at a time.
+        
         Args:
             usernames (List[str]): A list of TikTok usernames to scrape.
             
         Returns:
-            List[Dict[str, Any]]: A list of raw profile data items from the API.
+            List[Dict[str, Any]]: A list of raw profile data items from the API, in batch order.
         """
         if not usernames:
             logger.warning("No usernames provided to get_profile_data")
             return []
             
+        if len(usernames) <= self.batch_size:
+            return self._fetch_batch(usernames)
+            
+        batches = [usernames[i:i + self.batch_size] for i in range(0, len(usernames), self.batch_size)]
+        max_workers = min(self.max_concurrent_batches, len(batches))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(itertools.chain.from_iterable(executor.map(self._fetch_batch, batches)))
+            
+    def _fetch_batch(self, usernames: List[str]) -> List[Dict[str, Any]]:
+        """
+        Retrieves detailed profile data for one batch of usernames with a single Profile Scraper run.
+        
+        Args:
+            usernames (List[str]): A batch of TikTok usernames to scrape.
+            
+        Returns:
+            List[Dict[str, Any]]: A list of raw profile data items from the API.
+        """
+        key = None
+        if self.cache is not None:
+            key = "profiles:" + ",".join(sorted(usernames))
+            cached_results = self.cache.get(key)
+            if cached_results is not None:
+                return cached_results
+                
         logger.info(f"Retrieving profile data for {len(usernames)} usernames: {usernames[:5]}...")
         
         try:
@@ -54,11 +94,50 @@ class ProfileProcessor:
                 return []
                 
             logger.info(f"Successfully retrieved {len(profile_results)} profile data items.")
+            if key is not None:
+                self.cache.set(key, profile_results)
             return profile_results
             
         except Exception as e:
             logger.error(f"Error retrieving profile data for usernames {usernames[:5]}...: {e}")
             return []
+            
+    async def get_profile_data_async(self, usernames: List[str],
+                                     progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Retrieves detailed profile data in batches, running up to max_concurrent_batches
+        Profile Scraper API calls at the same time.
+        
+        Args:
+            usernames (List[str]): A list of TikTok usernames to scrape.
+            progress_callback (Optional[Callable[[int, int], None]]): Called as
+                (completed_batches, total_batches) each time a batch returns.
+            
+        Returns:
+            List[Dict[str, Any]]: A list of raw profile data items from the API, in batch order.
+        """
+        if not usernames:
+            logger.warning("No usernames provided to get_profile_data_async")
+            return []
+            
+        batches = [usernames[i:i + self.batch_size] for i in range(0, len(usernames), self.batch_size)]
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+        loop = asyncio.get_running_loop()
+        
+        async def fetch_batch(index: int, batch: List[str]):
+            async with semaphore:
+                # The Apify client is blocking, so run it in the default executor
+                return index, await loop.run_in_executor(None, self._fetch_batch, batch)
+                
+        batch_results = [[] for _ in batches]
+        tasks = [fetch_batch(index, batch) for index, batch in enumerate(batches)]
+        for completed, task in enumerate(asyncio.as_completed(tasks), start=1):
+            index, items = await task
+            batch_results[index] = items
+            if progress_callback:
+                progress_callback(completed, len(batches))
+                
+        return [item for items in batch_results for item in items]
 
 # Example usage (for testing purposes)
 if __name__ == '__main__':
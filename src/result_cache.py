@@ -0,0 +1,101 @@
+"""
+Result Cache Module - Persists Apify results on disk so repeated runs can skip the API
+"""
+
+import logging
+import os
+import pickle
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+class ResultCache:
+    """
+    A small on-disk key/value cache (backed by SQLite) whose entries expire after a TTL.
+    Every operation opens its own short-lived connection and SQLite handles the locking,
+    so one cache directory can be shared by several threads, parsers and processes.
+    """
+
+    def __init__(self, cache_dir: str, ttl_secs: float = 24 * 3600):
+        """
+        Initializes the ResultCache.
+
+        Args:
+            cache_dir (str): Directory holding the cache file (created if missing).
+            ttl_secs (float): Age in seconds after which an entry is ignored and refetched.
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self.ttl_secs = ttl_secs
+        self.path = os.path.join(cache_dir, "apify_results.sqlite3")
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, stored_at REAL, value BLOB)"
+            )
+        logger.info(f"Initialized ResultCache in {cache_dir} (TTL: {ttl_secs} seconds)")
+
+    @contextmanager
+    def _connect(self):
+        """
+        Opens a connection to the cache file for one operation, committing (or rolling back
+        on error) and closing it afterwards.
+
+        Yields:
+            sqlite3.Connection: The open connection.
+        """
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the cached value for a key, or None if it is missing or expired.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[Any]: The cached value, or None.
+        """
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT stored_at, value FROM results WHERE key = ?", (key,)
+                ).fetchone()
+            if row is None:
+                return None
+
+            stored_at, value = row
+            if time.time() - stored_at > self.ttl_secs:
+                return None
+
+            value = pickle.loads(value)
+        except Exception as e:
+            logger.warning(f"Could not read cache entry {key}: {e}")
+            return None
+
+        logger.info(f"Using cached result for {key}")
+        return value
+
+    def set(self, key: str, value: Any):
+        """
+        Stores a value under a key.
+
+        Args:
+            key (str): Cache key.
+            value (Any): Picklable value to store.
+        """
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (key, stored_at, value) VALUES (?, ?, ?)",
+                    (key, time.time(), data)
+                )
+        except Exception as e:
+            logger.warning(f"Could not write cache entry {key}: {e}")
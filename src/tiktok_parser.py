@@ -2,9 +2,13 @@
 TikTok Parser - Main module for orchestrating the TikTok parsing workflow
 """
 
+import asyncio
+import concurrent.futures
+import functools
+import itertools
 import logging
 import os
-from typing import List, Dict, Any, Set, Optional
+from typing import List, Dict, Any, Set, Optional, Callable
 
 from .config_manager import ConfigManager
 from .api_client import ApiClient
@@ -13,7 +17,8 @@ from .profile_processor import ProfileProcessor
 from .data_processor import DataProcessor
 from .email_extractor import EmailExtractor
 from .data_filter import DataFilter
-from .data_exporter import DataExporter
+from .data_exporter import DataExporter, CSV_FIELDS
+from .result_cache import ResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -22,15 +27,16 @@ class TikTokParser:
     Main class that orchestrates the TikTok parsing workflow.
     """
     
-    def __init__(self, config_file_path: Optional[str] = None):
+    def __init__(self, config_file_path: Optional[str] = None, config: Optional[Dict[str, Any]] = None):
         """
         Initializes the TikTokParser with configuration.
         
         Args:
             config_file_path (Optional[str]): Path to the configuration file.
+            config (Optional[Dict[str, Any]]): Configuration values to use instead of a config file.
         """
         # Initialize configuration
-        self.config_manager = ConfigManager(config_file_path or "config.json")
+        self.config_manager = ConfigManager(config_file_path or "config.json", config)
         
         # Get configuration values
         self.api_token = self.config_manager.get("apify_api_token")
@@ -40,22 +46,47 @@ class TikTokParser:
         self.require_email = self.config_manager.get("require_email", True)
         self.output_format = self.config_manager.get("output_format", "csv")
         self.output_dir = self.config_manager.get("output_dir", "./output_api")
+        self.max_concurrent_topics = self.config_manager.get("max_concurrent_topics", 8)
+        self.cache_ttl_hours = self.config_manager.get("cache_ttl_hours", 0)
         
         # Validate essential configuration
         if not self.api_token:
             raise ValueError("APIFY_API_TOKEN is not set. Please set it via environment variable or in config.json.")
             
         # Initialize components
+        # Optionally keep Apify results on disk so reruns of the same topics within the TTL skip the API
+        self.cache = None
+        if self.cache_ttl_hours:
+            self.cache = ResultCache(os.path.join(self.output_dir, ".cache"), self.cache_ttl_hours * 3600)
         self.api_client = ApiClient(self.api_token, self.tiktok_actor_id)
-        self.topic_processor = TopicProcessor(self.api_client, self.results_per_hashtag)
-        self.profile_processor = ProfileProcessor(self.api_client)
-        self.data_processor = DataProcessor()
         self.email_extractor = EmailExtractor()
+        # When emails are required, drop authors without one before fetching their detailed profiles
+        self.topic_processor = TopicProcessor(
+            self.api_client, 
+            self.results_per_hashtag, 
+            self.email_extractor if self.require_email else None,
+            self.cache
+        )
+        self.profile_processor = ProfileProcessor(self.api_client, cache=self.cache)
+        self.data_processor = DataProcessor()
         self.data_filter = DataFilter(self.email_extractor)
         self.data_exporter = DataExporter(self.output_dir)
         
         logger.info("TikTokParser initialized successfully.")
         
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "TikTokParser":
+        """
+        Creates a TikTokParser from an in-memory configuration dictionary.
+        
+        Args:
+            config (Dict[str, Any]): Configuration values (same keys as config.json).
+            
+        Returns:
+            TikTokParser: The initialized parser.
+        """
+        return cls(config=config)
+        
     def parse_topic(self, topic: str) -> List[Dict[str, Any]]:
         """
         Parses a single topic to find influencers with email addresses.
@@ -69,18 +100,73 @@ class TikTokParser:
         logger.info(f"Parsing topic: {topic}")
         
         # Step 1: Search for profiles by topic
-        usernames = self.topic_processor.get_profiles_from_topic(topic)
+        usernames = self._get_topic_usernames(topic)
         if not usernames:
-            logger.warning(f"No profiles found for topic: {topic}")
             return []
             
-        # Limit the number of profiles to process if needed
-        if len(usernames) > self.max_profiles_per_topic:
-            logger.info(f"Limiting profiles from {len(usernames)} to {self.max_profiles_per_topic}")
-            usernames = list(usernames)[:self.max_profiles_per_topic]
+        # Step 2: Get detailed profile data
+        profile_data = self.profile_processor.get_profile_data(usernames)
+        
+        # Steps 3 and 4: Process and filter the profile data
+        return self._process_topic_profiles(profile_data, topic)
+        
+    async def parse_topic_async(self, topic: str,
+                                progress_callback: Optional[Callable[[str, int, int], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Parses a single topic, fetching profile data in concurrent batches.
+        
+        Args:
+            topic (str): The topic (hashtag) to search for.
+            progress_callback (Optional[Callable[[str, int, int], None]]): Called as
+                (topic, completed_batches, total_batches) after each profile batch returns.
+            
+        Returns:
+            List[Dict[str, Any]]: List of processed and filtered influencer data.
+        """
+        logger.info(f"Parsing topic: {topic}")
+        loop = asyncio.get_running_loop()
+        
+        # Step 1: Search for profiles by topic
+        usernames = await loop.run_in_executor(None, self._get_topic_usernames, topic)
+        if not usernames:
+            return []
             
         # Step 2: Get detailed profile data
-        profile_data = self.profile_processor.get_profile_data(list(usernames))
+        batch_callback = functools.partial(progress_callback, topic) if progress_callback else None
+        profile_data = await self.profile_processor.get_profile_data_async(usernames, batch_callback)
+        
+        # Steps 3 and 4: Process and filter the profile data
+        return self._process_topic_profiles(profile_data, topic)
+        
+    def _get_topic_usernames(self, topic: str) -> List[str]:
+        """
+        Searches a topic and returns the usernames to fetch, limited to max_profiles_per_topic.
+        
+        Args:
+            topic (str): The topic (hashtag) to search for.
+            
+        Returns:
+            List[str]: Usernames found for the topic.
+        """
+        # The topic processor stops reading search results once the limit is reached
+        usernames = self.topic_processor.get_profiles_from_topic(topic, limit=self.max_profiles_per_topic)
+        if not usernames:
+            logger.warning(f"No profiles found for topic: {topic}")
+            return []
+            
+        return list(usernames)
+        
+    def _process_topic_profiles(self, profile_data: List[Dict[str, Any]], topic: str) -> List[Dict[str, Any]]:
+        """
+        Processes raw profile data for a topic and applies email filtering.
+        
+        Args:
+            profile_data (List[Dict[str, Any]]): Raw profile data items from the API.
+            topic (str): The topic (hashtag) the profiles were found under.
+            
+        Returns:
+            List[Dict[str, Any]]: List of processed and filtered influencer data.
+        """
         if not profile_data:
             logger.warning(f"No profile data retrieved for topic: {topic}")
             return []
@@ -98,38 +184,78 @@ class TikTokParser:
         """
         Parses multiple topics to find influencers with email addresses.
         
+        Topics are parsed in a thread pool of up to max_concurrent_topics workers, so the
+        blocking Apify calls for different topics overlap instead of running back to back.
+        
         Args:
             topics (List[str]): List of topics (hashtags) to search for.
             
         Returns:
             Dict[str, List[Dict[str, Any]]]: Dictionary mapping topics to lists of influencer data.
         """
-        results = {}
-        all_profiles = []
+        max_workers = max(1, min(self.max_concurrent_topics, len(topics)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map keeps the results in topic order
+            results = dict(zip(topics, executor.map(self.parse_topic, topics)))
+            
+        self._export_results(results)
+        return results
+        
+    async def parse_topics_async(self, topics: List[str],
+                                 progress_callback: Optional[Callable[[str, int, int], None]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Parses multiple topics concurrently, at most max_concurrent_topics at a time.
+        
+        The Apify client is blocking, so its calls run in the event loop's default
+        executor; the Apify calls for different topics then overlap instead of
+        running back to back.
         
-        for topic in topics:
-            topic_profiles = self.parse_topic(topic)
-            results[topic] = topic_profiles
-            all_profiles.extend(topic_profiles)
+        Args:
+            topics (List[str]): List of topics (hashtags) to search for.
+            progress_callback (Optional[Callable[[str, int, int], None]]): Called as
+                (topic, completed_batches, total_batches) after each profile batch returns.
             
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Dictionary mapping topics to lists of influencer data.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent_topics))
+        
+        async def parse_one(topic: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.parse_topic_async(topic, progress_callback)
+                
+        topic_results = await asyncio.gather(*(parse_one(topic) for topic in topics))
+        results = dict(zip(topics, topic_results))
+        
+        self._export_results(results)
+        return results
+        
+    def _export_results(self, results: Dict[str, List[Dict[str, Any]]]):
+        """
+        Exports topic-specific results and the combined results for all topics.
+        
+        Args:
+            results (Dict[str, List[Dict[str, Any]]]): Dictionary mapping topics to lists of influencer data.
+        """
+        for topic, topic_profiles in results.items():
             # Export topic-specific results
             if topic_profiles:
                 self.data_exporter.export_data(
                     topic_profiles, 
                     base_filename=f"topic_{topic}", 
-                    output_format=self.output_format
+                    output_format=self.output_format,
+                    fieldnames=CSV_FIELDS
                 )
                 
-        # Export combined results
-        if all_profiles:
+        # Export combined results, streaming the topic lists instead of concatenating them
+        if any(results.values()):
             self.data_exporter.export_data(
-                all_profiles, 
+                itertools.chain.from_iterable(results.values()), 
                 base_filename="all_topics", 
-                output_format=self.output_format
+                output_format=self.output_format,
+                fieldnames=CSV_FIELDS
             )
             
-        return results
-        
     def run(self, topics: List[str]) -> Dict[str, List[Dict[str, Any]]]:
         """
         Main entry point to run the parser with the given topics.
@@ -158,6 +284,41 @@ class TikTokParser:
         except Exception as e:
             logger.error(f"Error running TikTok parser: {e}")
             return {}
+            
+    async def run_async(self, topics: List[str],
+                        progress_callback: Optional[Callable[[str, int, int], None]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Asynchronous entry point to run the parser with the given topics.
+        
+        Topics are parsed concurrently, so async callers can await the parser
+        without blocking their event loop on Apify I/O.
+        
+        Args:
+            topics (List[str]): List of topics (hashtags) to search for.
+            progress_callback (Optional[Callable[[str, int, int], None]]): Called as
+                (topic, completed_batches, total_batches) after each profile batch returns.
+            
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Dictionary mapping topics to lists of influencer data.
+        """
+        if not topics:
+            logger.warning("No topics provided to parse.")
+            return {}
+            
+        logger.info(f"Starting TikTok parser with topics: {topics}")
+        
+        try:
+            results = await self.parse_topics_async(topics, progress_callback)
+            
+            # Log summary
+            total_profiles = sum(len(profiles) for profiles in results.values())
+            logger.info(f"Parsing completed. Found {total_profiles} profiles with email across {len(topics)} topics.")
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error running TikTok parser: {e}")
+            return {}
 
 # Example usage (for testing purposes)
 if __name__ == '__main__':
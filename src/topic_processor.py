@@ -3,9 +3,11 @@ Topic Processor Module - Handles searching TikTok by topic (hashtag)
 """
 
 import logging
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Set, Optional
 
 from .api_client import ApiClient
+from .email_extractor import EmailExtractor
+from .result_cache import ResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -15,49 +17,90 @@ class TopicProcessor:
     and identifying relevant user profiles.
     """
     
-    def __init__(self, api_client: ApiClient, results_per_hashtag: int = 50):
+    def __init__(self, api_client: ApiClient, results_per_hashtag: int = 50,
+                 email_extractor: Optional[EmailExtractor] = None, cache: Optional[ResultCache] = None):
         """
         Initializes the TopicProcessor.
         
         Args:
             api_client (ApiClient): Instance of the ApiClient for making API calls.
             results_per_hashtag (int): Number of video results to fetch per hashtag.
+            email_extractor (Optional[EmailExtractor]): If given, authors whose bio in the search
+                results has no email address are skipped, so their detailed profiles are never fetched.
+            cache (Optional[ResultCache]): If given, usernames found for a topic are reused from it
+                instead of searching the topic again.
         """
         self.api_client = api_client
         self.results_per_hashtag = results_per_hashtag
+        self.email_extractor = email_extractor
+        self.cache = cache
         
-    def get_profiles_from_topic(self, topic: str) -> Set[str]:
+    def get_profiles_from_topic(self, topic: str, limit: Optional[int] = None) -> Set[str]:
         """
         Searches a topic (hashtag) and extracts unique author usernames.
         
         Args:
             topic (str): The topic (hashtag) to search for.
+            limit (Optional[int]): Stop once this many usernames are found; remaining
+                result pages are then not downloaded.
             
         Returns:
             Set[str]: A set of unique author usernames found for the topic.
         """
+        if self.cache is None:
+            return self._search_topic(topic, limit)
+            
+        # Everything that changes the result is part of the key
+        key = f"topic:{topic}:{self.results_per_hashtag}:{limit}:{self.email_extractor is not None}"
+        cached_usernames = self.cache.get(key)
+        if cached_usernames is not None:
+            return set(cached_usernames)
+            
+        unique_usernames = self._search_topic(topic, limit)
+        if unique_usernames:
+            self.cache.set(key, unique_usernames)
+        return unique_usernames
+        
+    def _search_topic(self, topic: str, limit: Optional[int] = None) -> Set[str]:
+        """
+        Uncached implementation of get_profiles_from_topic.
+        """
         logger.info(f"Processing topic (hashtag): {topic}")
         unique_usernames = set()
         
         try:
-            # Search for videos using the hashtag
-            video_results = self.api_client.search_by_hashtag(
+            # Search for videos using the hashtag, streaming the results instead of holding them all
+            video_results = self.api_client.iter_search_by_hashtag(
                 hashtag=topic,
                 results_per_page=self.results_per_hashtag
             )
             
-            if not video_results:
-                logger.warning(f"No video results found for hashtag: {topic}")
-                return unique_usernames
-                
             # Extract unique author usernames from video results
+            skipped_usernames = set()
+            video_count = 0
             for item in video_results:
+                video_count += 1
                 author_meta = item.get("authorMeta")
                 if author_meta and isinstance(author_meta, dict):
                     username = author_meta.get("name") # Assuming 'name' is the username field
                     if username:
-                        unique_usernames.add(username)
+                        # The search results already carry the author's bio ("signature"); skip
+                        # authors without an email there. Authors without a bio are kept.
+                        bio = author_meta.get("signature")
+                        if self.email_extractor and bio is not None and not self.email_extractor.extract_email(bio):
+                            skipped_usernames.add(username)
+                        else:
+                            unique_usernames.add(username)
+                            if limit and len(unique_usernames) >= limit:
+                                logger.info(f"Reached the limit of {limit} authors for topic: {topic}")
+                                break
                         
+            if not video_count:
+                logger.warning(f"No video results found for hashtag: {topic}")
+                return unique_usernames
+                
+            if skipped_usernames - unique_usernames:
+                logger.info(f"Skipped {len(skipped_usernames - unique_usernames)} authors without an email in their bio for topic: {topic}")
             logger.info(f"Found {len(unique_usernames)} unique authors for topic: {topic}")
             
         except Exception as e:
@@ -4,8 +4,9 @@ Topic Searcher Module - Implements search functionality for TikTok topics and ha
 
 import asyncio
 import logging
-import re
+from itertools import chain, islice
 from urllib.parse import quote
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 logging.basicConfig(
     level=logging.INFO,
@@ -13,11 +14,74 @@ logging.basicConfig(
 )
 logger = logging.getLogger('topic_searcher')
 
+# Profile links typically start with /@username
+_PROFILE_LINK_SELECTOR = 'a[href^="/@"]'
+
+# User-card links; these nearly always also match _PROFILE_LINK_SELECTOR, so they are
+# only searched when the extra_profile_selectors config option is enabled
+_EXTRA_PROFILE_LINK_SELECTORS = [
+    'a[data-e2e="user-card-avatar"]',
+    'a[data-e2e="user-link"]'
+]
+
+# Matches once the search page's Users tab has rendered its user cards
+_USER_CARD_SELECTOR = ', '.join(_EXTRA_PROFILE_LINK_SELECTORS)
+
+# A bare profile link such as /@user, optionally with a trailing slash or query string;
+# rejects deeper links such as /@user/video/123. Written to be valid in both Python and
+# JavaScript, since it is matched inside the browser.
+_PROFILE_HREF_PATTERN = r'^/@([A-Za-z0-9_.\-]+)/?(?:[?#].*)?$'
+
+# Collects the unique usernames of profile links for all selectors in a single round trip
+# to the browser, stopping once limit usernames are found (0 for no limit)
+_PROFILE_USERNAMES_JS = """([selectors, pattern, limit]) => {
+    const profileHref = new RegExp(pattern);
+    const usernames = new Set();
+    for (const selector of selectors) {
+        for (const link of document.querySelectorAll(selector)) {
+            const match = profileHref.exec(link.getAttribute('href') || '');
+            if (match) {
+                usernames.add(match[1]);
+                if (limit && usernames.size >= limit) {
+                    return [...usernames];
+                }
+            }
+        }
+    }
+    return [...usernames];
+}"""
+
+def _unique(items):
+    """
+    Yield items in order, skipping any already yielded
+    
+    Args:
+        items (iterable): Hashable items, possibly with duplicates
+        
+    Yields:
+        Each distinct item once, in first-seen order
+    """
+    seen = set()
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            yield item
+
 class TopicSearcher:
     """
     Implements search functionality for finding TikTok influencers by topic/hashtag
     """
     
+    __slots__ = (
+        'browser_manager',
+        'base_url',
+        'search_results',
+        'max_results',
+        'topic_concurrency',
+        'profile_link_selectors',
+        '_seen_profiles'
+    )
+    
     def __init__(self, browser_manager):
         """
         Initialize the topic searcher with a browser manager
@@ -28,18 +92,35 @@ class TopicSearcher:
         self.browser_manager = browser_manager
         self.base_url = "https://www.tiktok.com"
         self.search_results = []
-        self.max_results = self.browser_manager.config.get('results_limit', 100)
+        
+        # Read configuration once; search methods only use these attributes
+        config = self.browser_manager.config
+        self.max_results = config.get('results_limit', 100)
+        self.topic_concurrency = config.get('topic_concurrency', 4)
+        
+        # Selectors for links that might point to creator profiles
+        self.profile_link_selectors = [_PROFILE_LINK_SELECTOR]
+        if config.get('extra_profile_selectors', False):
+            self.profile_link_selectors += _EXTRA_PROFILE_LINK_SELECTORS
+        
+        # Profile URLs already returned for any topic, so overlapping creators are scraped once
+        self._seen_profiles = set()
     
-    async def search_by_hashtag(self, hashtag):
+    async def search_by_hashtag(self, hashtag, page=None):
         """
         Search TikTok by hashtag
         
         Args:
             hashtag (str): Hashtag to search for (without # symbol)
+            page (Page, optional): Page to search on; defaults to a page from the browser manager's pool
             
         Returns:
             list: List of profile URLs found
         """
+        if page is None:
+            async with self.browser_manager.acquire_page() as page:
+                return await self.search_by_hashtag(hashtag, page)
+        
         # Ensure hashtag doesn't have # prefix
         clean_hashtag = hashtag.strip().lstrip('#')
         search_url = f"{self.base_url}/tag/{quote(clean_hashtag)}"
@@ -47,53 +128,113 @@ class TopicSearcher:
         logger.info(f"Searching for hashtag: #{clean_hashtag}")
         
         # Navigate to hashtag page
-        page = await self.browser_manager.navigate(search_url)
+        page = await self.browser_manager.navigate(search_url, page)
         
-        # Handle login popup if it appears
-        await self.browser_manager.handle_login_popup()
+        # Handle login popup if it appears and hasn't already been dismissed in this page's context
+        if not self.browser_manager.login_popup_handled(page):
+            await self.browser_manager.handle_login_popup(page)
         
-        # Scroll to load more content
-        await self.browser_manager.scroll_page(scrolls=5)
+        # Scroll until enough distinct profiles are linked or the page stops loading more
+        await self.browser_manager.scroll_until(
+            _PROFILE_LINK_SELECTOR,
+            target=self.max_results,
+            page=page,
+            href_pattern=_PROFILE_HREF_PATTERN
+        )
         
         # Extract creator profiles from the hashtag page
-        return await self._extract_profiles_from_page()
+        return await self._extract_profiles_from_page(page, limit=self.max_results)
     
-    async def search_by_keyword(self, keyword):
+    async def search_by_keyword(self, keyword, page=None):
         """
         Search TikTok by keyword
         
         Args:
             keyword (str): Keyword to search for
+            page (Page, optional): Page to search on; defaults to a page from the browser manager's pool
             
         Returns:
             list: List of profile URLs found
         """
+        if page is None:
+            async with self.browser_manager.acquire_page() as page:
+                return await self.search_by_keyword(keyword, page)
+        
         search_url = f"{self.base_url}/search?q={quote(keyword)}"
         
         logger.info(f"Searching for keyword: {keyword}")
         
         # Navigate to search page
-        page = await self.browser_manager.navigate(search_url)
+        page = await self.browser_manager.navigate(search_url, page)
         
-        # Handle login popup if it appears
-        await self.browser_manager.handle_login_popup()
+        # Handle login popup if it appears and hasn't already been dismissed in this page's context
+        if not self.browser_manager.login_popup_handled(page):
+            await self.browser_manager.handle_login_popup(page)
         
         # Click on "Users" tab to filter for user profiles
         try:
             await page.click('text="Users"')
-            await asyncio.sleep(2)
         except Exception as e:
             logger.warning(f"Could not click Users tab: {e}")
+        else:
+            # Continue as soon as the user cards render instead of sleeping a fixed time
+            try:
+                await page.wait_for_selector(_USER_CARD_SELECTOR, timeout=self.browser_manager.content_timeout)
+            except PlaywrightTimeoutError:
+                logger.warning(f"No user cards appeared after clicking Users tab for '{keyword}'")
         
-        # Scroll to load more content
-        await self.browser_manager.scroll_page(scrolls=5)
+        # Scroll until enough distinct profiles are linked or the page stops loading more
+        await self.browser_manager.scroll_until(
+            _PROFILE_LINK_SELECTOR,
+            target=self.max_results,
+            page=page,
+            href_pattern=_PROFILE_HREF_PATTERN
+        )
         
         # Extract creator profiles from the search page
-        return await self._extract_profiles_from_page()
+        return await self._extract_profiles_from_page(page, limit=self.max_results)
+    
+    async def search_by_users_endpoint(self, keyword, page=None):
+        """
+        Search TikTok's user search results, which list matching accounts directly
+        
+        Args:
+            keyword (str): Keyword to search for
+            page (Page, optional): Page to search on; defaults to a page from the browser manager's pool
+            
+        Returns:
+            list: List of profile URLs found
+        """
+        if page is None:
+            async with self.browser_manager.acquire_page() as page:
+                return await self.search_by_users_endpoint(keyword, page)
+        
+        search_url = f"{self.base_url}/search/user?q={quote(keyword)}"
+        
+        logger.info(f"Searching users for keyword: {keyword}")
+        
+        # Navigate to user search page
+        page = await self.browser_manager.navigate(search_url, page)
+        
+        # Handle login popup if it appears and hasn't already been dismissed in this page's context
+        if not self.browser_manager.login_popup_handled(page):
+            await self.browser_manager.handle_login_popup(page)
+        
+        # Scroll until enough distinct profiles are linked or the page stops loading more
+        await self.browser_manager.scroll_until(
+            _PROFILE_LINK_SELECTOR,
+            target=self.max_results,
+            page=page,
+            href_pattern=_PROFILE_HREF_PATTERN
+        )
+        
+        # Extract creator profiles from the user search page
+        return await self._extract_profiles_from_page(page, limit=self.max_results)
     
     async def search_by_topic(self, topic):
         """
-        Search TikTok by topic (tries both hashtag and keyword search)
+        Search TikTok by topic. Tries the user search results first, and falls back to
+        hashtag and keyword search if they turn up too few profiles.
         
         Args:
             topic (str): Topic to search for
@@ -103,47 +244,84 @@ class TopicSearcher:
         """
         logger.info(f"Searching for topic: {topic}")
         
-        # Try hashtag search first
-        hashtag_results = await self.search_by_hashtag(topic)
-        
-        # Then try keyword search
-        keyword_results = await self.search_by_keyword(topic)
+        # One navigation to the user search page is usually enough
+        try:
+            user_results = await self.search_by_users_endpoint(topic)
+        except Exception as e:
+            logger.warning(f"User search failed for topic '{topic}': {e}")
+            user_results = []
         
-        # Combine and deduplicate results
-        all_results = hashtag_results + keyword_results
-        unique_results = list(dict.fromkeys(all_results))
+        if len(user_results) >= max(1, self.max_results // 2):
+            unique_results = user_results[:self.max_results]
+        else:
+            logger.info(f"User search found {len(user_results)} profiles for topic '{topic}', trying hashtag and keyword search")
+            fallback_results = await self._search_hashtag_and_keyword(topic)
+            
+            # Combine and deduplicate results, stopping at the limit
+            unique_results = list(islice(_unique(chain(user_results, fallback_results)), self.max_results))
         
         logger.info(f"Found {len(unique_results)} unique profiles for topic '{topic}'")
         
-        return unique_results[:self.max_results]
+        return unique_results
     
-    async def _extract_profiles_from_page(self):
+    async def _search_hashtag_and_keyword(self, topic):
+        """
+        Search TikTok by both hashtag and keyword for a topic
+        
+        Args:
+            topic (str): Topic to search for
+            
+        Returns:
+            list: List of unique profile URLs found, at most max_results
+        """
+        # Run hashtag and keyword searches concurrently, each on its own pooled page
+        keyword_task = asyncio.create_task(self.search_by_keyword(topic))
+        try:
+            hashtag_results = await self.search_by_hashtag(topic)
+        except BaseException:
+            keyword_task.cancel()
+            raise
+        
+        # Hashtag results alone fill the limit, so stop the keyword search early
+        if len(hashtag_results) >= self.max_results:
+            keyword_task.cancel()
+            try:
+                await keyword_task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.debug(f"Keyword search for '{topic}' failed before it was cancelled: {e}")
+            
+            logger.info(f"Hashtag search filled the limit for topic '{topic}', skipped keyword search")
+            return hashtag_results[:self.max_results]
+        
+        keyword_results = await keyword_task
+        
+        # Combine and deduplicate results, stopping at the limit
+        return list(islice(_unique(chain(hashtag_results, keyword_results)), self.max_results))
+    
+    async def _extract_profiles_from_page(self, page=None, limit=None):
         """
         Extract profile URLs from the current page
         
+        Args:
+            page (Page, optional): Page to extract from; defaults to the browser manager's main page
+            limit (int, optional): Stop once this many unique profiles are found
+            
         Returns:
             list: List of profile URLs
         """
+        page = page or self.browser_manager.page
         profile_urls = []
         
         try:
             # Extract profile links using various selectors that might contain profile links
-            selectors = [
-                'a[href^="/@"]',  # Profile links typically start with /@username
-                'a[data-e2e="user-card-avatar"]',
-                'a[data-e2e="user-link"]'
-            ]
-            
-            for selector in selectors:
-                elements = await self.browser_manager.page.query_selector_all(selector)
-                
-                for element in elements:
-                    href = await element.get_attribute('href')
-                    
-                    if href and href.startswith('/@'):
-                        full_url = f"{self.base_url}{href}"
-                        if full_url not in profile_urls:
-                            profile_urls.append(full_url)
+            # Only real profile links are kept, normalized to /@username so variants collapse together
+            usernames = await page.evaluate(
+                _PROFILE_USERNAMES_JS,
+                [self.profile_link_selectors, _PROFILE_HREF_PATTERN, limit or 0]
+            )
+            profile_urls = [f"{self.base_url}/@{username}" for username in usernames]
             
             logger.info(f"Extracted {len(profile_urls)} profile URLs")
             
@@ -152,13 +330,14 @@ class TopicSearcher:
         
         return profile_urls
     
-    async def get_top_influencers(self, topic, limit=None):
+    async def get_top_influencers(self, topic, limit=None, new_only=False):
         """
         Get top influencers for a specific topic
         
         Args:
             topic (str): Topic to search for
             limit (int, optional): Maximum number of influencers to return
+            new_only (bool): Only return profiles not already returned for an earlier topic
             
         Returns:
             list: List of profile URLs for top influencers
@@ -170,25 +349,54 @@ class TopicSearcher:
         profiles = await self.search_by_topic(topic)
         
         # Limit results
-        return profiles[:limit]
+        profiles = profiles[:limit]
+        
+        # Remember profiles across topics
+        new_profiles = [url for url in profiles if url not in self._seen_profiles]
+        self._seen_profiles.update(new_profiles)
+        
+        if len(new_profiles) < len(profiles):
+            logger.info(f"{len(profiles) - len(new_profiles)} profiles for topic '{topic}' were already found for other topics")
+        
+        return new_profiles if new_only else profiles
     
-    async def get_multiple_topics(self, topics):
+    async def get_multiple_topics(self, topics, new_only=False):
         """
         Get influencers for multiple topics
         
         Args:
             topics (list): List of topics to search for
+            new_only (bool): Only list each profile under the first topic it is found for,
+                so callers scrape overlapping creators once
             
         Returns:
             dict: Dictionary mapping topics to lists of profile URLs
         """
-        results = {}
+        # Search topics concurrently; navigations are still spaced out by the browser manager
+        semaphore = asyncio.Semaphore(self.topic_concurrency)
+        tasks = [asyncio.create_task(self._search_one_topic(semaphore, topic, new_only)) for topic in topics]
+        topic_results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        for topic in topics:
-            profiles = await self.get_top_influencers(topic)
+        results = {}
+        for topic, profiles in zip(topics, topic_results):
+            if isinstance(profiles, Exception):
+                logger.error(f"Error searching topic '{topic}': {profiles}")
+                profiles = []
             results[topic] = profiles
-            
-            # Add delay between topics to avoid rate limiting
-            await asyncio.sleep(self.browser_manager.request_delay * 2)
         
         return results
+    
+    async def _search_one_topic(self, semaphore, topic, new_only=False):
+        """
+        Get influencers for one topic while holding a concurrency slot
+        
+        Args:
+            semaphore (asyncio.Semaphore): Semaphore bounding concurrent topic searches
+            topic (str): Topic to search for
+            new_only (bool): Only return profiles not already returned for another topic
+            
+        Returns:
+            list: List of profile URLs for top influencers
+        """
+        async with semaphore:
+            return await self.get_top_influencers(topic, new_only=new_only)
@@ -0,0 +1,130 @@
+"""
+Tests for ApiClient against a mocked Apify client
+"""
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+from src.api_client import ApiClient
+
+class RunActorTest(unittest.TestCase):
+    
+    def setUp(self):
+        patcher = mock.patch('src.api_client.ApifyClient')
+        self.apify = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.actor = self.apify.actor.return_value
+        self.client = ApiClient("token")
+        
+    def test_waits_server_side_for_the_run(self):
+        self.actor.call.return_value = {"id": "run-1", "status": "SUCCEEDED"}
+        
+        self.assertEqual(self.client.run_actor_with_input("actor/x", {"a": 1}, timeout_secs=60), "run-1")
+        self.apify.actor.assert_called_once_with("actor/x")
+        self.actor.call.assert_called_once_with(run_input={"a": 1}, wait_secs=60)
+        # The run status comes back with the call; it is never polled
+        self.apify.run.assert_not_called()
+        
+    def test_failed_runs_return_none(self):
+        for status in ("FAILED", "ABORTED", "TIMED-OUT"):
+            with self.subTest(status=status):
+                self.actor.call.return_value = {"id": "run-1", "status": status}
+                self.assertIsNone(self.client.run_actor_with_input("actor/x", {}))
+                
+    def test_waits_until_the_run_finishes_by_default(self):
+        self.actor.call.return_value = {"id": "run-1", "status": "SUCCEEDED"}
+        
+        self.client.run_actor_with_input("actor/x", {})
+        self.actor.call.assert_called_once_with(run_input={}, wait_secs=None)
+        
+    def test_unfinished_runs_return_none(self):
+        # A run still going after timeout_secs has an incomplete dataset
+        for status in ("READY", "RUNNING", "TIMING-OUT"):
+            with self.subTest(status=status):
+                self.actor.call.return_value = {"id": "run-1", "status": status}
+                self.assertIsNone(self.client.run_actor_with_input("actor/x", {}, timeout_secs=5))
+                
+    def test_missing_run_or_api_error_returns_none(self):
+        self.actor.call.return_value = None
+        self.assertIsNone(self.client.run_actor_with_input("actor/x", {}))
+        
+        self.actor.call.side_effect = RuntimeError("network down")
+        self.assertIsNone(self.client.run_actor_with_input("actor/x", {}))
+        
+    def test_start_without_waiting(self):
+        self.actor.start.return_value = {"id": "run-2", "status": "READY"}
+        
+        self.assertEqual(self.client.run_actor_with_input("actor/x", {}, wait_for_finish=False), "run-2")
+        self.actor.call.assert_not_called()
+
+def _profile_item(username):
+    return {"authorMeta": {"name": username, "fans": 10}}
+
+class DetailedProfilesTest(unittest.TestCase):
+    
+    def setUp(self):
+        patcher = mock.patch('src.api_client.ApifyClient')
+        apify = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        # Each run gets its own dataset, holding a profile for every username it was asked for
+        self.requested = []
+        self.call = apify.actor.return_value.call
+        self.call.side_effect = self.start_run
+        apify.run.side_effect = lambda run_id: mock.Mock(**{"get.return_value": {"defaultDatasetId": run_id}})
+        apify.dataset.side_effect = lambda dataset_id: mock.Mock(**{"iterate_items.side_effect": lambda limit=None: iter(
+            [_profile_item(username) for username in self.requested[int(dataset_id)]])})
+        self.client = ApiClient("token")
+        
+    def start_run(self, run_input, wait_secs):
+        self.requested.append(run_input["profiles"])
+        return {"id": str(len(self.requested) - 1), "status": "SUCCEEDED"}
+        
+    def test_fetched_profiles_are_reused(self):
+        self.assertEqual(self.client.get_detailed_profiles(["alice", "bob", "alice"]),
+                         [_profile_item("alice"), _profile_item("bob")])
+        self.assertEqual(self.client.get_detailed_profiles(["bob"]), [_profile_item("bob")])
+        self.assertEqual(self.call.call_count, 1)
+        
+    def test_only_new_usernames_are_sent_to_the_actor(self):
+        self.client.get_detailed_profiles(["alice"])
+        
+        self.assertEqual(self.client.get_detailed_profiles(["alice", "carol"]),
+                         [_profile_item("alice"), _profile_item("carol")])
+        self.assertEqual(self.requested, [["alice"], ["carol"]])
+        
+    def test_concurrent_lookups_share_one_fetch(self):
+        started, release = threading.Event(), threading.Event()
+        
+        def slow_start_run(run_input, wait_secs):
+            run = self.start_run(run_input, wait_secs)
+            if not started.is_set():
+                started.set()
+                release.wait(5)
+            return run
+            
+        self.call.side_effect = slow_start_run
+        results = {}
+        first = threading.Thread(target=lambda: results.update(
+            first=self.client.get_detailed_profiles(["alice", "bob"])))
+        first.start()
+        self.assertTrue(started.wait(5))
+        
+        # bob is being fetched by the first thread, so only carol starts a second run
+        second = threading.Thread(target=lambda: results.update(
+            second=self.client.get_detailed_profiles(["bob", "carol"])))
+        second.start()
+        deadline = time.monotonic() + 5
+        while len(self.requested) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        first.join(5)
+        second.join(5)
+        
+        self.assertEqual(results["first"], [_profile_item("alice"), _profile_item("bob")])
+        self.assertEqual(results["second"], [_profile_item("bob"), _profile_item("carol")])
+        self.assertEqual(self.requested, [["alice", "bob"], ["carol"]])
+
+if __name__ == '__main__':
+    unittest.main()
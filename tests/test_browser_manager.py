@@ -0,0 +1,73 @@
+"""
+Tests for BrowserManager's pooled pages, with a fake browser in place of Playwright
+"""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from browser_manager import BrowserManager
+
+class FakeContext:
+    
+    def __init__(self):
+        self.closed = False
+        
+    async def new_page(self):
+        return mock.Mock(close=mock.AsyncMock())
+        
+    async def close(self):
+        self.closed = True
+
+class AcquirePageTest(unittest.IsolatedAsyncioTestCase):
+    
+    def setUp(self):
+        self.manager = BrowserManager({'pool_size': 1, 'blocked_resource_types': []})
+        self.contexts = []
+        
+        async def new_context(**options):
+            self.contexts.append(FakeContext())
+            return self.contexts[-1]
+            
+        browser = mock.Mock(new_context=new_context)
+        self.manager._get_browser = mock.AsyncMock(return_value=browser)
+        
+    async def test_context_is_reused(self):
+        for _ in range(3):
+            async with self.manager.acquire_page():
+                pass
+                
+        self.assertEqual(len(self.contexts), 1)
+        await self.manager.close()
+        self.assertTrue(self.contexts[0].closed)
+        
+    async def test_page_returned_after_close(self):
+        async with self.manager.acquire_page():
+            await self.manager.close()
+            
+        self.assertTrue(self.contexts[0].closed)
+        self.assertIsNone(self.manager._context_pool)
+        
+    async def test_waiter_is_released_by_close(self):
+        waiter_done = asyncio.Event()
+        
+        async def wait_for_page():
+            try:
+                async with self.manager.acquire_page():
+                    pass
+            finally:
+                waiter_done.set()
+                
+        async with self.manager.acquire_page():
+            waiter = asyncio.create_task(wait_for_page())
+            await asyncio.sleep(0)
+            await self.manager.close()
+            
+        await asyncio.wait_for(waiter_done.wait(), 1)
+        with self.assertRaises(RuntimeError):
+            await waiter
+        self.assertEqual(len(self.contexts), 1)
+        self.assertTrue(self.contexts[0].closed)
+
+if __name__ == '__main__':
+    unittest.main()
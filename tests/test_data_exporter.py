@@ -0,0 +1,65 @@
+"""
+Tests for DataExporter's file writers
+"""
+
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from src.data_exporter import DataExporter, CSV_FIELDS
+
+PROFILES = [
+    {"topic": "art", "username": "alice", "followers": 1500, "bio": "painter\ncontact: alice@example.com",
+     "email": "alice@example.com", "has_email": 1},
+    {"topic": "art", "username": "bob", "followers": 7, "bio": "no email here, just \"quotes\"",
+     "email": None, "has_email": 0},
+]
+
+class DataExporterTest(unittest.TestCase):
+    
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.exporter = DataExporter(tmp.name)
+        
+    def read_lines(self, filename):
+        with open(os.path.join(self.exporter.output_dir, filename), encoding="utf-8") as f:
+            return f.read().splitlines()
+            
+    def test_csv_header_is_csv_fields(self):
+        rows = PROFILES + [{"username": "carol", "followers": 3, "internal_note": "not exported"}]
+        self.exporter.export_data(iter(rows), "topic_art", output_format="csv", fieldnames=CSV_FIELDS)
+        
+        with open(os.path.join(self.exporter.output_dir, "topic_art.csv"), newline="", encoding="utf-8") as f:
+            header, *records = list(csv.reader(f))
+            
+        self.assertEqual(header, list(CSV_FIELDS))
+        self.assertEqual(len(records), len(rows))
+        alice, bob, carol = (dict(zip(header, record)) for record in records)
+        self.assertEqual((alice["followers"], alice["email"]), ("1500", "alice@example.com"))
+        self.assertEqual(alice["bio"], PROFILES[0]["bio"])
+        self.assertEqual(bob["email"], "")
+        self.assertEqual((carol["topic"], carol["username"]), ("", "carol"))
+        
+    def test_csv_header_defaults_to_first_row_keys(self):
+        self.exporter.export_data([{"b": 1, "a": 2}, {"a": 3}], "plain", output_format="csv")
+        
+        self.assertEqual(self.read_lines("plain.csv"), ["b,a", "1,2", ",3"])
+        
+    def test_jsonl_writes_one_object_per_line(self):
+        # A generator is consumed as it is written, like the streamed all_topics export
+        self.exporter.export_data((profile for profile in PROFILES), "topic_art", output_format="jsonl")
+        
+        lines = self.read_lines("topic_art.jsonl")
+        self.assertEqual(len(lines), len(PROFILES))
+        self.assertEqual([json.loads(line) for line in lines], PROFILES)
+        
+    def test_empty_data_writes_no_file(self):
+        for output_format in ("csv", "json", "jsonl"):
+            self.exporter.export_data([], "empty", output_format=output_format)
+            self.assertFalse(os.path.exists(os.path.join(self.exporter.output_dir, f"empty.{output_format}")))
+
+if __name__ == '__main__':
+    unittest.main()
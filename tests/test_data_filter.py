@@ -0,0 +1,48 @@
+"""
+Tests for the email filters' has_email flag
+"""
+
+import unittest
+
+from email_filter import EmailFilter
+from src.data_filter import DataFilter
+from src.email_extractor import EmailExtractor
+
+BIOS = ["Contact: alice@example.com", "no email here", "", "ping bob@mail.net or carol@mail.net"]
+
+def _profiles():
+    return [{"username": f"user{i}", "bio": bio, "email": None, "has_email": 0} for i, bio in enumerate(BIOS)]
+
+class HasEmailTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.data_filter = DataFilter(EmailExtractor())
+        
+    def assert_flags(self, profiles, expected):
+        flags = [profile["has_email"] for profile in profiles]
+        self.assertEqual(flags, expected)
+        # 0/1 ints, never bools, so every export path writes the same CSV values
+        self.assertTrue(all(type(flag) is int for flag in flags), flags)
+        
+    def test_data_filter_keeps_everything(self):
+        self.assert_flags(self.data_filter.apply_email_filter(_profiles(), require_email=False), [1, 0, 0, 1])
+        
+    def test_data_filter_requires_email(self):
+        filtered = self.data_filter.apply_email_filter(_profiles(), require_email=True)
+        
+        self.assertEqual([profile["email"] for profile in filtered], ["alice@example.com", "bob@mail.net"])
+        self.assert_flags(filtered, [1, 1])
+        
+    def test_data_filter_without_extraction(self):
+        profiles = self.data_filter.apply_email_filter(_profiles(), require_email=False, extract_anyway=False)
+        self.assert_flags(profiles, [0, 0, 0, 0])
+        
+    def test_email_filter_sets_the_same_flags(self):
+        profiles = _profiles()
+        filtered = EmailFilter().filter_profiles(profiles)
+        
+        self.assert_flags(profiles, [1, 0, 0, 1])
+        self.assertEqual([profile["username"] for profile in filtered], ["user0", "user3"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+Tests for the EmailExtractor email regex
+"""
+
+import unittest
+
+from src.email_extractor import EmailExtractor
+
+class EmailExtractorTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.extractor = EmailExtractor()
+        
+    def test_extracts_plain_addresses(self):
+        self.assertEqual(self.extractor.extract_email("Contact me at my.email+test@example.co.uk for details."),
+                         "my.email+test@example.co.uk")
+        self.assertEqual(self.extractor.extract_email("email: another-email_123@subdomain.example.com."),
+                         "another-email_123@subdomain.example.com")
+        
+    def test_no_address(self):
+        self.assertIsNone(self.extractor.extract_email("Bio with no email address."))
+        self.assertIsNone(self.extractor.extract_email(""))
+        self.assertIsNone(self.extractor.extract_email(None))
+        
+    def test_rejects_image_file_names(self):
+        self.assertIsNone(self.extractor.extract_email("avatar: name@2x.png"))
+        self.assertIsNone(self.extractor.extract_email("x@foo.bar.png"))
+        self.assertIsNone(self.extractor.extract_email("user@mail.jpg_x"))
+        self.assertIsNone(self.extractor.extract_email("PIC@Header.JPEG"))
+        
+    def test_skips_image_file_name_for_real_address(self):
+        text = "Image: profile.jpg, email: false.positive@image.png, real: contact@domain.info"
+        self.assertEqual(self.extractor.extract_email(text), "contact@domain.info")
+        
+    def test_keeps_domains_that_merely_contain_image_words(self):
+        self.assertEqual(self.extractor.extract_email("hi@pngstudio.com"), "hi@pngstudio.com")
+        self.assertEqual(self.extractor.extract_email("hi@site.pngx.com"), "hi@site.pngx.com")
+
+if __name__ == '__main__':
+    unittest.main()
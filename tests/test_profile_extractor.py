@@ -0,0 +1,62 @@
+"""
+Tests for ProfileExtractor's count parsing and profile extraction
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from profile_extractor import ProfileExtractor
+
+class ParseCountTest(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        # _parse_count never touches the browser; the extractor only reads its config
+        cls.parse_count = ProfileExtractor(SimpleNamespace(config={}))._parse_count
+        
+    def test_plain_numbers(self):
+        self.assertEqual(self.parse_count("0"), 0)
+        self.assertEqual(self.parse_count("987"), 987)
+        self.assertEqual(self.parse_count("1,200"), 1200)
+        self.assertEqual(self.parse_count(" 42 "), 42)
+        
+    def test_suffixes(self):
+        self.assertEqual(self.parse_count("500K"), 500000)
+        self.assertEqual(self.parse_count("12.3K"), 12300)
+        self.assertEqual(self.parse_count("1.5M"), 1500000)
+        self.assertEqual(self.parse_count("2B"), 2000000000)
+        
+    def test_unparseable_text_is_zero(self):
+        for text in ("", "abc", "1.2.3", "K", "10 followers"):
+            with self.subTest(text=text):
+                self.assertEqual(self.parse_count(text), 0)
+
+class ExtractProfileDataTest(unittest.IsolatedAsyncioTestCase):
+    
+    def setUp(self):
+        page = mock.Mock(evaluate=mock.AsyncMock(return_value={
+            'display_name': 'Alice', 'bio': 'contact: alice@example.com',
+            'followers': '1.2K', 'following': '10', 'likes': '3M'}))
+        self.manager = mock.Mock(config={}, navigate=mock.AsyncMock(return_value=page),
+                                 handle_login_popup=mock.AsyncMock(return_value=True))
+        self.extractor = ProfileExtractor(self.manager)
+        
+    async def test_dismisses_login_popup_in_a_new_context(self):
+        self.manager.login_popup_handled.return_value = False
+        
+        profile = await self.extractor.extract_profile_data("https://www.tiktok.com/@alice")
+        
+        self.manager.handle_login_popup.assert_awaited_once()
+        self.assertEqual((profile['username'], profile['followers'], profile['likes']), ('alice', 1200, 3000000))
+        self.assertEqual((profile['email'], profile['has_email']), ('alice@example.com', 1))
+        
+    async def test_skips_login_popup_once_handled(self):
+        self.manager.login_popup_handled.return_value = True
+        
+        await self.extractor.extract_profile_data("https://www.tiktok.com/@alice")
+        
+        self.manager.handle_login_popup.assert_not_awaited()
+
+if __name__ == '__main__':
+    unittest.main()
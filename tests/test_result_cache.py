@@ -0,0 +1,58 @@
+"""
+Tests for the on-disk ResultCache
+"""
+
+import tempfile
+import unittest
+from unittest import mock
+
+from src.result_cache import ResultCache
+
+class ResultCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = tmp.name
+        
+    def open_cache(self, ttl_secs=60):
+        return ResultCache(self.cache_dir, ttl_secs=ttl_secs)
+        
+    def test_round_trip_and_missing_key(self):
+        cache = self.open_cache()
+        cache.set("profiles:alice", [{"authorMeta": {"name": "alice"}}])
+        
+        self.assertEqual(cache.get("profiles:alice"), [{"authorMeta": {"name": "alice"}}])
+        self.assertIsNone(cache.get("profiles:bob"))
+        
+    def test_entry_expires_after_ttl(self):
+        cache = self.open_cache(ttl_secs=60)
+        with mock.patch("src.result_cache.time.time", return_value=1000.0):
+            cache.set("topic:art", ["alice"])
+            
+        with mock.patch("src.result_cache.time.time", return_value=1060.0):
+            self.assertEqual(cache.get("topic:art"), ["alice"])
+        with mock.patch("src.result_cache.time.time", return_value=1060.5):
+            self.assertIsNone(cache.get("topic:art"))
+            
+    def test_entries_survive_reopening(self):
+        self.open_cache().set("topic:art", ["alice", "bob"])
+        
+        self.assertEqual(self.open_cache().get("topic:art"), ["alice", "bob"])
+        
+    def test_instances_share_one_directory(self):
+        first, second = self.open_cache(), self.open_cache()
+        first.set("topic:art", ["alice"])
+        second.set("topic:food", ["bob"])
+        second.set("topic:art", ["carol"])
+        
+        self.assertEqual((first.get("topic:art"), first.get("topic:food")), (["carol"], ["bob"]))
+        
+    def test_unpicklable_value_is_skipped(self):
+        cache = self.open_cache()
+        cache.set("topic:art", lambda: None)
+        
+        self.assertIsNone(cache.get("topic:art"))
+
+if __name__ == '__main__':
+    unittest.main()